@@ -0,0 +1,41 @@
+"""Compare the per-call latency of `parallel_apply` with and without persistent pool.
+
+Usage: python benchmarks/persistent_pool.py [NB_CALLS] [NB_ROWS]
+"""
+
+import math
+import sys
+from time import time
+
+import numpy as np
+import pandas as pd
+
+from pandarallel import pandarallel
+
+
+def measure(df, nb_calls):
+    """Return the mean duration (in seconds) of a `parallel_apply` call."""
+    start = time()
+
+    for _ in range(nb_calls):
+        df.a.parallel_apply(math.sqrt)
+
+    return (time() - start) / nb_calls
+
+
+def main(nb_calls=50, nb_rows=10000):
+    df = pd.DataFrame(dict(a=np.random.rand(nb_rows)))
+
+    pandarallel.initialize(verbose=0)
+    without_pool = measure(df, nb_calls)
+
+    with pandarallel.initialize(verbose=0, persistent_pool=True):
+        with_pool = measure(df, nb_calls)
+
+    print("Rows per call: {}, calls: {}".format(nb_rows, nb_calls))
+    print("Without persistent pool: {:8.2f} ms / call".format(without_pool * 1000))
+    print("With persistent pool:    {:8.2f} ms / call".format(with_pool * 1000))
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,52 @@
+"""Display when each chunk starts and ends being processed by workers.
+
+Chunks are sent to workers as soon as they are dumped, so first chunks start while the
+main process still dumps the next ones: start times are staggered, instead of all
+being after the time needed to dump the whole input.
+
+Usage: python benchmarks/pipelined_dumping.py [NB_ROWS] [NB_WORKERS]
+"""
+
+import sys
+from time import time
+
+import numpy as np
+import pandas as pd
+
+from pandarallel import pandarallel
+from pandarallel.utils.tools import chunk
+
+
+def timestamp(_):
+    return time()
+
+
+def main(nb_rows=4000000, nb_workers=4):
+    # Strings are pickled in-band, so dumping them is slow
+    series = pd.Series(np.random.rand(nb_rows).astype(str))
+
+    for use_memory_fs in (True, False):
+        pandarallel.initialize(
+            nb_workers=nb_workers, use_memory_fs=use_memory_fs, verbose=0
+        )
+
+        start = time()
+        timestamps = series.parallel_apply(timestamp).values - start
+        duration = time() - start
+
+        print("Memory file system" if use_memory_fs else "Pipe")
+
+        for index, chunk_ in enumerate(chunk(nb_rows, nb_workers)):
+            print(
+                "  Chunk {}: processed from {:6.0f} ms to {:6.0f} ms".format(
+                    index,
+                    timestamps[chunk_].min() * 1000,
+                    timestamps[chunk_].max() * 1000,
+                )
+            )
+
+        print("  Total: {:6.0f} ms".format(duration * 1000))
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,71 @@
+"""Display the overhead per call of the function to apply, for each mechanism
+publishing its progress.
+
+- inlining: `progress_pre_func` is inlined into the bytecode of the function (Python
+  3.5 to 3.8 only)
+- sampling (wrapper): Calls are counted by a wrapper, and the count is sampled by a
+  background thread
+- sampling (sys.monitoring): Calls are counted by a `sys.monitoring` callback (Python
+  3.12 and above only), and the count is sampled by a background thread
+
+Usage: python benchmarks/progress_overhead.py [NB_ROWS]
+"""
+
+import sys
+from itertools import count
+from multiprocessing import get_context
+from time import time
+
+import numpy as np
+import pandas as pd
+
+from pandarallel.pandarallel import progress_pre_func
+from pandarallel.utils.inliner import IS_INLINING_SUPPORTED, inline
+from pandarallel.utils.sampling import IS_MONITORING_AVAILABLE, SampledProgress
+from pandarallel.utils.status_channel import Progression, StatusChannel
+
+
+def func(x):
+    return x
+
+
+def measure(series, func_):
+    start = time()
+    series.apply(func_)
+    return time() - start
+
+
+def main(nb_rows=1000000):
+    series = pd.Series(np.random.rand(nb_rows))
+    progression = Progression(StatusChannel(get_context("fork"), 1), 0, 0)
+
+    reference = measure(series, func)
+    durations = dict()
+
+    if IS_INLINING_SUPPORTED:
+        inlined_func = inline(
+            progress_pre_func, func, dict(progression=progression, counter=count())
+        )
+
+        durations["inlining"] = measure(series, inlined_func)
+
+    with SampledProgress(progression, use_monitoring=False) as sampled_progress:
+        durations["sampling (wrapper)"] = measure(series, sampled_progress.wrap(func))
+
+    if IS_MONITORING_AVAILABLE:
+        with SampledProgress(progression, use_monitoring=True) as sampled_progress:
+            monitored_func = sampled_progress.wrap(func)
+            durations["sampling (sys.monitoring)"] = measure(series, monitored_func)
+
+    print("Without progress: {:6.1f} ns per call".format(reference / nb_rows * 1e9))
+
+    for mechanism, duration in durations.items():
+        print(
+            "{}: {:+6.1f} ns per call".format(
+                mechanism, (duration - reference) / nb_rows * 1e9
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -7,6 +7,12 @@ class DataFrame:
     def reduce(results, _):
         return pd.concat(results, copy=False)
 
+    @staticmethod
+    def get_chunks(nb_workers, df, *_, **__):
+        """Chunks of rows."""
+        for chunk_ in chunk(df.shape[0], nb_workers):
+            yield df.iloc[chunk_]
+
     class Apply:
         @staticmethod
         def get_chunks(nb_workers, df, *args, **kwargs):
@@ -26,16 +32,20 @@ class DataFrame:
 
         @staticmethod
         def worker(
-            df, _index, _meta_args, _progress_bar, _queue, func, *args, **kwargs
+            df, _index, _meta_args, _progression, _progress_bar, func, *args, **kwargs
         ):
             return df.apply(func, *args, **kwargs)
 
     class ApplyMap:
         @staticmethod
-        def get_chunks(nb_workers, df, *_):
-            for chunk_ in chunk(df.shape[0], nb_workers):
-                yield df.iloc[chunk_]
+        def worker(df, _index, _meta_args, _progression, _progress_bar, func, *_):
+            return df.applymap(func)
+
+    class MapPartitions:
+        """`func` is called once per chunk of rows, with the whole chunk."""
 
         @staticmethod
-        def worker(df, _index, _meta_args, _progress_bar, _queue, func, *_):
-            return df.applymap(func)
+        def worker(
+            df, _index, _meta_args, _progression, _progress_bar, func, *args, **kwargs
+        ):
+            return func(df, *args, **kwargs)
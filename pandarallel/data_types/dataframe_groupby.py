@@ -1,6 +1,7 @@
 import itertools
 import pandas as pd
-from pandarallel.utils.tools import chunk
+from pandarallel.utils.groups import Groups
+from pandarallel.utils.tools import balance
 
 
 class DataFrameGroupBy:
@@ -10,30 +11,48 @@ class DataFrameGroupBy:
 
     @staticmethod
     def reduce(results, df_grouped):
-        results = itertools.chain.from_iterable(results)
-        keys, values, mutated = zip(*results)
+        # Groups are not sent to workers in key order (see `get_chunks`)
+        results = sorted(itertools.chain.from_iterable(results), key=lambda x: x[0])
+        _, keys, values, mutated = zip(*results)
         mutated = any(mutated)
         return df_grouped._wrap_applied_output(
             keys, values, not_indexed_same=df_grouped.mutated or mutated
         )
 
     @staticmethod
-    def get_chunks(nb_workers, df_grouped, *args, **kwargs):
-        chunks = chunk(len(df_grouped), nb_workers)
-        iterator = iter(df_grouped)
+    def get_chunks(group_cost=None):
+        """Return a function splitting groups into chunks of approximatively the same
+        cost.
 
-        for chunk_ in chunks:
-            yield [next(iterator) for _ in range(chunk_.stop - chunk_.start)]
+        The cost of a group is `group_cost(nb_rows)`, where `nb_rows` is the number of
+        rows of the group. If `group_cost` is None, the cost of a group is its number
+        of rows.
+
+        Each group is sent with its position, so results can be put back in key order.
+        """
+
+        def closure(nb_workers, df_grouped, *args, **kwargs):
+            groups = Groups(df_grouped)
+            costs = (
+                groups.lengths
+                if group_cost is None
+                else [group_cost(length) for length in groups.lengths]
+            )
+
+            for positions in balance(costs, nb_workers):
+                yield groups.get_chunk(positions)
+
+        return closure
 
     @staticmethod
     def worker(
-        tuples, _index, _meta_args, _progress_bar, _queue, func, *args, **kwargs
+        chunk, _index, _meta_args, _progression, _progress_bar, func, *args, **kwargs
     ):
         keys, results, mutated = [], [], []
-        for key, df in tuples:
+        for key, df in chunk:
             res = func(df, *args, **kwargs)
             results.append(res)
             mutated.append(not pd.core.groupby.ops._is_indexed_like(res, df.axes))
             keys.append(key)
 
-        return zip(keys, results, mutated)
+        return zip(chunk.positions, keys, results, mutated)
@@ -4,7 +4,8 @@ from datetime import timedelta
 import pandas as pd
 from pandas.tseries.frequencies import to_offset
 
-from pandarallel.utils.tools import chunk, PROGRESSION
+from pandarallel.utils.groups import Groups
+from pandarallel.utils.tools import chunk
 
 
 class ExpandingGroupBy:
@@ -14,11 +15,10 @@ class ExpandingGroupBy:
 
     @staticmethod
     def get_chunks(nb_workers, expanding_groupby, *args, **kwargs):
-        chunks = chunk(len(expanding_groupby._groupby), nb_workers)
-        iterator = iter(expanding_groupby._groupby)
+        groups = Groups(expanding_groupby._groupby)
 
-        for chunk_ in chunks:
-            yield [next(iterator) for _ in range(chunk_.stop - chunk_.start)]
+        for chunk_ in chunk(len(groups), nb_workers):
+            yield groups.get_chunk(range(chunk_.start, chunk_.stop))
 
     @staticmethod
     def att2value(expanding):
@@ -30,17 +30,17 @@ class ExpandingGroupBy:
 
     @staticmethod
     def worker(
-        tuples, index, attribute2value, queue, progress_bar, func, *args, **kwargs
+        chunk, index, attribute2value, progression, progress_bar, func, *args, **kwargs
     ):
         # TODO: See if this pd.concat is avoidable
         results = []
 
-        for iteration, (name, df) in enumerate(tuples):
+        for iteration, (name, df) in enumerate(chunk):
             item = df.expanding(**attribute2value).apply(func, *args, **kwargs)
             item.index = pd.MultiIndex.from_product([[name], item.index])
             results.append(item)
 
             if progress_bar:
-                queue.put_nowait((PROGRESSION, (index, iteration)))
+                progression.update(iteration)
 
         return pd.concat(results)
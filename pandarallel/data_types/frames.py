@@ -0,0 +1,10 @@
+class Frames:
+    """Items (DataFrames, Series, ...) of an iterable processed by `pandarallel.imap`.
+
+    Each item is a chunk on its own."""
+
+    @staticmethod
+    def worker(
+        data, _index, _meta_args, _progression, _progress_bar, func, *args, **kwargs
+    ):
+        return func(data, *args, **kwargs)
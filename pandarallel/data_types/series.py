@@ -15,13 +15,36 @@ class Series:
     class Apply:
         @staticmethod
         def worker(
-            series, _index, _meta_args, _progress_bar, _queue, func, *args, **kwargs
+            series,
+            _index,
+            _meta_args,
+            _progression,
+            _progress_bar,
+            func,
+            *args,
+            **kwargs
         ):
             return series.apply(func, *args, **kwargs)
 
     class Map:
         @staticmethod
         def worker(
-            series, _index, _meta_args, _progress_bar, _queue, func, *_, **kwargs
+            series, _index, _meta_args, _progression, _progress_bar, func, *_, **kwargs
         ):
             return series.map(func, **kwargs)
+
+    class MapPartitions:
+        """`func` is called once per chunk, with the whole chunk."""
+
+        @staticmethod
+        def worker(
+            series,
+            _index,
+            _meta_args,
+            _progression,
+            _progress_bar,
+            func,
+            *args,
+            **kwargs
+        ):
+            return func(series, *args, **kwargs)
@@ -22,7 +22,14 @@ class SeriesRolling:
 
     @staticmethod
     def worker(
-        series, index, attribue2value, _progress_bar, _queue, func, *args, **kwargs
+        series,
+        index,
+        attribue2value,
+        _progression,
+        _progress_bar,
+        func,
+        *args,
+        **kwargs
     ):
         result = series.rolling(**attribue2value).apply(func, *args, **kwargs)
 
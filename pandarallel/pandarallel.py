@@ -1,11 +1,16 @@
 """Main Pandarallel file"""
 
+import cProfile
 import os
-import pickle
-from itertools import count
+import sys
+import threading
+from contextlib import contextmanager
+from itertools import count, islice
 from multiprocessing import get_context
+from multiprocessing.pool import ThreadPool
 from tempfile import NamedTemporaryFile
 from time import time
+from types import FunctionType
 
 from pandas import DataFrame, Series
 from pandas.core.groupby import DataFrameGroupBy
@@ -16,11 +21,31 @@ from pandarallel.data_types.dataframe import DataFrame as DF
 from pandarallel.data_types.dataframe_groupby import DataFrameGroupBy as DFGB
 from pandarallel.data_types.rolling_groupby import RollingGroupBy as RGB
 from pandarallel.data_types.expanding_groupby import ExpandingGroupBy as EGB
+from pandarallel.data_types.frames import Frames
 from pandarallel.data_types.series import Series as S
 from pandarallel.data_types.series_rolling import SeriesRolling as SR
-from pandarallel.utils.inliner import inline
+from pandarallel.utils import mapped_pickle
+from pandarallel.utils.adaptive import (
+    decide,
+    get_nb_cells,
+    get_nb_sample_chunks,
+    get_transfer_rates,
+)
+from pandarallel.utils.broadcast import Broadcast, resolve
+from pandarallel.utils.inliner import IS_INLINING_SUPPORTED, inline
+from pandarallel.utils.latency import LatencyHistogram
+from pandarallel.utils.memory import MEMORY_FS_ROOT, dump_with_spill, get_size
 from pandarallel.utils.progress_bars import get_progress_bars, is_notebook_lab
-from pandarallel.utils.tools import ERROR, INPUT_FILE_READ, PROGRESSION, VALUE
+from pandarallel.utils.sampling import IS_MONITORING_AVAILABLE, SampledProgress
+from pandarallel.utils.shared_memory import (
+    SharedChunk,
+    is_shared_memory_available,
+    share,
+    start_resource_tracker,
+)
+from pandarallel.utils.stats import Stats, emit
+from pandarallel.utils.status_channel import Progression, StatusChannel
+from pandarallel.utils.tools import ERROR, INPUT_FILE_READ, VALUE
 
 # Python 3.8 on MacOS by default uses "spawn" instead of "fork" as start method for new
 # processes, which is incompatible with pandarallel. We force it to use "fork" method.
@@ -35,16 +60,33 @@ PREFIX_INPUT = PREFIX + "input_"
 PREFIX_OUTPUT = PREFIX + "output_"
 SUFFIX = ".pickle"
 
-# Root of Memory File System
-MEMORY_FS_ROOT = "/dev/shm"
+# Backends: workers are either processes forked from the MASTER, or threads of the
+# MASTER
+PROCESSES, THREADS = BACKENDS = ("processes", "threads")
+
+# From Python 3.12, cProfile is process-wide (it relies on `sys.monitoring`), so
+# threads cannot profile themselves at once
+IS_THREAD_PROFILING_SUPPORTED = sys.version_info < (3, 12)
 
 NO_PROGRESS, PROGRESS_IN_WORKER, PROGRESS_IN_FUNC, PROGRESS_IN_FUNC_MUL = list(range(4))
 
+# Period (in seconds) between two refreshes of progress bars
+PROGRESS_REFRESH_PERIOD = 0.25
+
+# Each call is identified by a generation, so messages related to a previous call
+# (which may still be sent to a status channel shared across calls) are ignored
+generations = count()
+
+# Each call of a function to apply is identified by a call id, so workers of the
+# persistent pool undill the function only once per call (see `get_call`), whatever the
+# number of generations (waves) of the call
+call_ids = count()
+
+# Decision of the last call made with `adaptive` (see `pandarallel.last_decision`)
+last_decision = None
 
-class ProgressState:
-    last_put_iteration = None
-    next_put_iteration = None
-    last_put_time = None
+# Stats of the last call (see `pandarallel.last_stats`)
+last_stats = None
 
 
 # The goal of this part is to let Pandarallel to serialize functions which are not defined
@@ -52,16 +94,140 @@ class ProgressState:
 # this article: https://medium.com/@yasufumy/python-multiprocessing-c6d54107dd55
 # Warning: In this article, the trick is presented to be able to serialize lambda functions.
 # Even if Pandarallel is able to serialize lambda functions, it is only thanks to `dill`.
-_func = None
+#
+# State of the worker, set by `worker_init`. Workers of the threads backend are threads
+# of the MASTER, so this state is local to the thread running the worker:
+# - func: The prepared data type worker (see `prepare_worker`)
+# - channel, slot: Status channel shared with the MASTER, and progression slot of this
+#   worker
+# - inherited_chunks: Chunks inherited from the MASTER (see `InheritedChunk`)
+# - inherited_call, loaded_calls: Function to apply with its arguments, as a (function,
+#   args, kwargs) tuple, either inherited from the MASTER, or undilled (once per call)
+#   from the dilled call broadcasted to workers. In the latter case, calls are kept by
+#   call id, with their dilled call, as long as they run (several calls can run at
+#   once with `pandarallel.imap`).
+_worker = threading.local()
+
+
+def worker_init(func, channel, inherited_chunks=None, inherited_call=None):
+    _worker.func = func
+    _worker.channel = channel
+    _worker.slot = channel.acquire_slot()
+    _worker.inherited_chunks = inherited_chunks
+    _worker.inherited_call = inherited_call
+    _worker.loaded_calls = dict()
+
+
+def get_call(call_id, dilled_call):
+    """Return the function to apply, with its arguments. Runs on WORKERS.
+
+    If `dilled_call` is None, the call has been inherited from the MASTER. Else, it is
+    the handle of the dilled call (see `Broadcast`), loaded and undilled only for the
+    first chunk of the call processed by this worker. Calls which are over (whose
+    dilled call is removed by the MASTER) are forgotten.
+
+    Broadcasted objects (see `pandarallel.broadcast`) are replaced by their value.
+    """
+    if dilled_call is None:
+        func, args, kwargs = _worker.inherited_call
+    else:
+        loaded_calls = _worker.loaded_calls
+
+        if call_id not in loaded_calls:
+            for loaded_call_id, (loaded_dilled_call, _) in list(loaded_calls.items()):
+                if not os.path.exists(loaded_dilled_call.path):
+                    del loaded_calls[loaded_call_id]
 
+            loaded_calls[call_id] = dilled_call, dill.loads(dilled_call.load_once())
 
-def worker_init(func):
-    global _func
-    _func = func
+        _, (func, args, kwargs) = loaded_calls[call_id]
+
+    return resolve_call(func, args, kwargs)
+
+
+def resolve_call(func, args, kwargs):
+    """Replace broadcasted objects of a call (see `pandarallel.broadcast`) by their
+    value."""
+    args = [resolve(arg) for arg in args]
+    kwargs = {key: resolve(value) for key, value in kwargs.items()}
+
+    return resolve(func), args, kwargs
 
 
 def global_worker(x):
-    return _func(x)
+    return _worker.func(x)
+
+
+def persistent_worker(task):
+    """Entry point of workers of the persistent pool.
+
+    Workers of the persistent pool are created before any data type worker is known,
+    so (contrary to `global_worker`) the worker is sent with each task. Data type
+    workers are static methods, so they are pickled by reference.
+    """
+    use_memory_fs, profile, collect_latency, worker, worker_args = task
+    return prepare_worker(use_memory_fs, profile, collect_latency)(worker)(worker_args)
+
+
+class InheritedChunk:
+    """Reference to a chunk workers inherited from the MASTER at fork time.
+
+    The MASTER computes chunks (which are mostly views on the data to process) before
+    creating workers, so workers get them for free with the copy-on-write memory of
+    the fork. Only this reference is sent to workers, instead of the pickled chunk.
+    """
+
+    def __init__(self, index, length):
+        self.index = index
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+
+class PersistentPool:
+    """Pool of workers (and its status channel) created once by `pandarallel.initialize`
+    and reused by every `parallel_*` call until it is shut down.
+
+    It can be shut down explicitly with `shutdown` (or `pandarallel.shutdown`), or be
+    used as a context manager.
+    """
+
+    def __init__(self, nb_workers):
+        self.nb_workers = nb_workers
+        self.channel = StatusChannel(context, nb_workers)
+        self.pool = context.Pool(nb_workers, worker_init, (None, self.channel))
+        self.is_alive = True
+
+    def shutdown(self):
+        """Stop workers. Calling this function twice is harmless."""
+        if not self.is_alive:
+            return
+
+        self.is_alive = False
+        self.pool.close()
+        self.pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.shutdown()
+
+
+def stop_pool(pool, exception):
+    """Stop `pool` (created for a single call) after `exception` interrupted the call.
+
+    Chunks of the call are cancelled (see `StatusChannel.cancel`), so workers are soon
+    done, and the pool is closed and joined. Workers are only terminated on a
+    KeyboardInterrupt: a worker killed while sending a result holds the lock of the
+    result queue forever, which deadlocks `Pool.terminate`.
+    """
+    if isinstance(exception, KeyboardInterrupt):
+        pool.terminate()
+    else:
+        pool.close()
+        pool.join()
 
 
 def is_memory_fs_available():
@@ -69,7 +235,21 @@ def is_memory_fs_available():
     return os.path.exists(MEMORY_FS_ROOT)
 
 
-def prepare_worker(use_memory_fs):
+def check_backend(backend, profile=False):
+    """Raise a ValueError if `backend` is not one of BACKENDS, or does not support
+    `profile`"""
+    if backend not in BACKENDS:
+        raise ValueError(
+            "`backend` must be one of {}".format(", ".join(map(repr, BACKENDS)))
+        )
+
+    if backend == THREADS and profile and not IS_THREAD_PROFILING_SUPPORTED:
+        raise ValueError(
+            "`profile` cannot be used with the threads backend with Python >= 3.12"
+        )
+
+
+def prepare_worker(use_memory_fs, profile=False, collect_latency=False):
     def closure(function):
         def wrapper(worker_args):
             """This function runs on WORKERS.
@@ -77,15 +257,28 @@ def prepare_worker(use_memory_fs):
             If Memory File System is used:
             1. Load all pickled files (previously dumped by the MASTER) in the
                Memory File System
-            2. Undill the function to apply (for lambda functions)
-            3. Tell to the MASTER the input file has been read (so the MASTER can remove it
+            2. Tell to the MASTER the input file has been read (so the MASTER can remove it
                from the memory
+            3. Get the function to apply (see `get_call`), and wrap it to display
+               progress bars
             4. Apply the function
             5. Pickle the result in the Memory File System (so the Master can read it)
-            6. Tell the master task is finished
+            6. Tell the master task is finished, with the time spent in 1. to 3.
+               (load), 4. (compute) and 5. (dump)
+
+            If `profile` is set, 1. to 5. are run under cProfile, and the profile is
+            sent to the MASTER with 6.
+
+            If `collect_latency` is set, the function to apply is also wrapped in 3. to
+            record the duration of each of its calls, and the latency histogram is sent
+            to the MASTER with 6.
+
+            If Memory File System is not used, steps are the same except 1., 2. and 5.
+            which are skipped. If the chunk is in shared memory, 1. consists in rebuilding
+            the chunk over the shared memory segment.
 
-            If Memory File System is not used, steps are the same except 1. and 5. which are
-            skipped.
+            If the call has been cancelled by the MASTER (see `StatusChannel.cancel`),
+            the chunk is skipped if not processed yet, and its result is not dumped.
             """
             if use_memory_fs:
                 (
@@ -93,314 +286,608 @@ def prepare_worker(use_memory_fs):
                     output_file_path,
                     index,
                     meta_args,
-                    queue,
+                    generation,
                     progress_bar,
-                    dilled_func,
-                    args,
-                    kwargs,
+                    call_id,
+                    dilled_call,
                 ) = worker_args
-
-                try:
-                    with open(input_file_path, "rb") as file:
-                        data = pickle.load(file)
-                        queue.put((INPUT_FILE_READ, index))
-
-                    result = function(
-                        data,
-                        index,
-                        meta_args,
-                        queue,
-                        progress_bar,
-                        dill.loads(dilled_func),
-                        *args,
-                        **kwargs
-                    )
-
-                    with open(output_file_path, "wb") as file:
-                        pickle.dump(result, file)
-
-                    queue.put((VALUE, index))
-
-                except Exception:
-                    queue.put((ERROR, index))
-                    raise
             else:
                 (
                     data,
                     index,
                     meta_args,
-                    queue,
+                    generation,
                     progress_bar,
-                    dilled_func,
-                    args,
-                    kwargs,
+                    call_id,
+                    dilled_call,
                 ) = worker_args
 
-                try:
+            if _worker.channel.is_cancelled(generation):
+                return None
+
+            # Only calls displaying progress bars use the progression slot, so the
+            # slot is not overwritten by chunks of another call running at once
+            # (`pandarallel.imap`)
+            progression = (
+                Progression(_worker.channel, _worker.slot, index)
+                if progress_bar
+                else None
+            )
+            timings = dict(pid=os.getpid())
+            profiler = cProfile.Profile() if profile else None
+            latency = LatencyHistogram() if collect_latency else None
+
+            try:
+                if profiler is not None:
+                    profiler.enable()
+
+                start = time()
+
+                if use_memory_fs:
+                    data = mapped_pickle.load(input_file_path)
+                    _worker.channel.put((generation, INPUT_FILE_READ, index))
+
+                elif isinstance(data, SharedChunk):
+                    data = data.attach()
+                    _worker.channel.put((generation, INPUT_FILE_READ, index))
+
+                elif isinstance(data, InheritedChunk):
+                    data = _worker.inherited_chunks[data.index]
+
+                func, args, kwargs = get_call(call_id, dilled_call)
+
+                in_func = progress_bar >= PROGRESS_IN_FUNC
+
+                with progress_wrapper(in_func, progression, func) as func:
+                    # Only Python functions are timed (see `progress_wrapper`)
+                    if not isinstance(func, FunctionType):
+                        latency = None
+
+                    elif latency is not None:
+                        func = latency.wrap(func)
+
+                    timings["load"] = time() - start
+                    start = time()
+
                     result = function(
                         data,
                         index,
                         meta_args,
-                        queue,
-                        progress_bar,
-                        dill.loads(dilled_func),
+                        progression,
+                        progress_bar == PROGRESS_IN_WORKER,
+                        func,
                         *args,
                         **kwargs
                     )
-                    queue.put((VALUE, index))
 
-                    return result
+                timings["compute"] = time() - start
+                start = time()
+
+                if use_memory_fs:
+                    # Files of a cancelled call are removed by the MASTER, so they must
+                    # not be created again
+                    if not _worker.channel.is_cancelled(generation):
+                        mapped_pickle.dump(result, output_file_path, must_exist=True)
 
-                except Exception:
-                    queue.put((ERROR, index))
-                    raise
+                    result = None
+
+                timings["dump"] = time() - start
+
+                if profiler is not None:
+                    profiler.disable()
+                    profiler.create_stats()
+
+                profile_stats = None if profiler is None else profiler.stats
+                latency_counts = None if latency is None else latency.counts
+                value = index, timings, profile_stats, latency_counts
+                _worker.channel.put((generation, VALUE, value))
+
+                return result
+
+            except Exception:
+                if profiler is not None:
+                    profiler.disable()
+
+                _worker.channel.put((generation, ERROR, index))
+                raise
 
         return wrapper
 
     return closure
 
 
-def create_temp_files(nb_files):
-    """Create temporary files in Memory File System."""
+def create_temp_files(nb_files, directory=MEMORY_FS_ROOT):
+    """Create temporary files in Memory File System (or in `directory`)."""
     return [
-        NamedTemporaryFile(prefix=PREFIX_INPUT, suffix=SUFFIX, dir=MEMORY_FS_ROOT)
+        NamedTemporaryFile(prefix=PREFIX_INPUT, suffix=SUFFIX, dir=directory)
         for _ in range(nb_files)
     ]
 
 
-def progress_pre_func(queue, index, counter, progression, state, time):
-    """Send progress to the MASTER about every 250 ms.
+def dump_chunk(chunk, spill_dir):
+    """Create input & output files of `chunk`, and dump `chunk` into the input file.
 
-    The estimation system is implemented to avoid to call time() to often,
-    which is time consuming.
+    Files are created in Memory File System if it has enough free space for both the
+    chunk and its result (estimated to be as big as the chunk), else in `spill_dir`
+    (see `dump_with_spill`).
+
+    Return the input file and the output file.
     """
-    iteration = next(counter)
 
-    if iteration == state.next_put_iteration:
-        time_now = time()
-        queue.put_nowait((progression, (index, iteration)))
+    def dump(directory):
+        files = []
+
+        try:
+            files = create_temp_files(2, directory)
+            input_file, _ = files
+            mapped_pickle.dump(chunk, input_file.name)
+            return files
+
+        except OSError:
+            for file in files:
+                file.close()
 
-        delta_t = time_now - state.last_put_time
-        delta_i = iteration - state.last_put_iteration
+            raise
 
-        state.next_put_iteration += max(int((delta_i / delta_t) * 0.25), 1)
-        state.last_put_iteration = iteration
-        state.last_put_time = time_now
+    return dump_with_spill(chunk, dump, spill_dir, nb_copies=2)
 
 
-def progress_wrapper(progress_bar, queue, index, chunk_size):
-    """Wrap the function to apply in a function which monitor the part of work already done.
+def progress_pre_func(progression, counter):
+    """Publish progress to the MASTER.
 
-    inline is used instead of traditional wrapping system to avoid unnecessary function call
-    (and context switch) which is time consuming.
+    Progress is a plain write into the progression slot of the worker (see
+    `Progression`), in memory shared with the MASTER, which reads it on its own timer.
+    It is cheap enough to be done at each call, without any throttling.
     """
-    counter = count()
-    state = ProgressState()
-    state.last_put_iteration = 0
-    state.next_put_iteration = max(chunk_size // 100, 1)
-    state.last_put_time = time()
-
-    def wrapper(func):
-        if progress_bar:
-            wrapped_func = inline(
-                progress_pre_func,
-                func,
-                dict(
-                    queue=queue,
-                    index=index,
-                    counter=counter,
-                    progression=PROGRESSION,
-                    state=state,
-                    time=time,
-                ),
-            )
-            return wrapped_func
+    progression.progresses[progression.offset] = next(counter)
 
-        return func
 
-    return wrapper
+@contextmanager
+def progress_wrapper(progress_bar, progression, func):
+    """Yield the function to apply, wrapped in a function which monitor the part of work
+    already done.
+
+    If the Python version supports it, inline is used instead of traditional wrapping
+    system to avoid unnecessary function call (and context switch) which is time
+    consuming. Else, calls are counted, and the count is sampled by a background thread
+    until the end of the `with` block (see `SampledProgress`).
+
+    Only Python functions can be wrapped. Other mappers (dict, Series, ...) are returned
+    unchanged, and progress is then only updated once the chunk is done.
+    """
+    if not progress_bar or not isinstance(func, FunctionType):
+        yield func
+
+    elif IS_INLINING_SUPPORTED:
+        yield inline(
+            progress_pre_func, func, dict(progression=progression, counter=count())
+        )
+
+    else:
+        # `sys.monitoring` counts calls of all threads, so it can only be used if the
+        # worker is the only thread applying the function (not with the threads
+        # backend)
+        use_monitoring = (
+            IS_MONITORING_AVAILABLE
+            and threading.current_thread() is threading.main_thread()
+        )
+
+        with SampledProgress(progression, use_monitoring) as sampled_progress:
+            yield sampled_progress.wrap(func)
 
 
 def get_workers_args(
     use_memory_fs,
-    nb_workers,
+    use_shared_memory,
     progress_bar,
     chunks,
     worker_meta_args,
-    queue,
-    func,
-    args,
-    kwargs,
+    generation,
+    call_id,
+    dilled_call,
+    chunk_lengths,
+    input_files,
+    output_files,
+    spill_dir,
+    stats,
 ):
     """This function is run on the MASTER.
 
-    If Memory File System is used:
-    1. Create temporary files in Memory File System
-    2. Dump chunked input files into Memory File System
-       (So they can be read by workers)
-    3. Break input data into several chunks
-    4. Wrap the function to apply to display progress bars
-    5. Dill the function to apply (to handle lambda functions)
-    6. Return the function to be sent to workers and path of files
+    For each chunk, if Memory File System is used:
+    1. Create temporary files in Memory File System (or in `spill_dir`, see
+       `dump_chunk`)
+    2. Dump the chunk into Memory File System
+       (So it can be read by workers)
+    3. Yield the arguments to be sent to workers, including paths of files
        in the Memory File System
 
     If Memory File System is not used, steps are the same except 1. and 2. which are
-    skipped. For step 6., paths are not returned.
-    """
+    skipped. For step 3., paths are replaced by the chunk itself. If shared memory is
+    used, numeric values of the chunk are copied into a shared memory segment.
 
-    def dump_and_get_lenght(chunk, input_file):
-        with open(input_file.name, "wb") as file:
-            pickle.dump(chunk, file)
+    Arguments of a chunk are yielded as soon as the chunk is dumped, so the chunk can be
+    processed by a worker while next chunks are dumped. Lengths of chunks, and files
+    (or shared memory segments) are appended to `chunk_lengths`, `input_files` and
+    `output_files`, so the caller can remove files even if an error occurs.
 
-        return len(chunk)
+    The function to apply and its arguments are dilled and broadcasted once for all
+    chunks, so only the handle `dilled_call` (and the id of the call) is sent with each
+    chunk, or not at all (None) if workers inherit them. The function is wrapped to
+    display progress bars by workers themselves, because progressions are written in
+    memory shared by inheritance.
 
-    if use_memory_fs:
-        input_files = create_temp_files(nb_workers)
+    Time spent to compute chunks and to dump them is added to `stats`.
+    """
+    for index, chunk in enumerate(stats.timed(chunks, "chunking")):
+        chunk_lengths.append(len(chunk))
 
-        try:
-            chunk_lengths = [
-                dump_and_get_lenght(chunk, input_file)
-                for chunk, input_file in zip(chunks, input_files)
-            ]
+        if use_memory_fs:
+            try:
+                with stats.measure("input_dump"):
+                    input_file, output_file = dump_chunk(chunk, spill_dir)
 
-            nb_chunks = len(chunk_lengths)
-            output_files = create_temp_files(nb_chunks)
+                input_files.append(input_file)
+                output_files.append(output_file)
 
-        except OSError:
-            link = "https://stackoverflow.com/questions/58804022/how-to-resize-dev-shm"
-            msg = " ".join(
-                (
-                    "It seems you use Memory File System and you don't have enough",
-                    "available space in `dev/shm`. You can either call",
-                    "pandarallel.initalize with `use_memory_fs=False`, or you can ",
-                    "increase the size of `dev/shm` as described here:",
-                    link,
-                    ".",
-                    " Please also remove all files beginning with 'pandarallel_' in the",
-                    "`/dev/shm` directory. If you have troubles with your web browser,",
-                    "these troubles should deseapper after cleaning `/dev/shm`.",
+            except OSError:
+                link = (
+                    "https://stackoverflow.com/questions/58804022/how-to-resize-dev-shm"
                 )
-            )
-            raise OSError(msg)
+                msg = " ".join(
+                    (
+                        "It seems you use Memory File System and you don't have enough",
+                        "available space in `dev/shm`, nor in the directory chunks are",
+                        "spilled to. You can either call pandarallel.initalize with",
+                        "`use_memory_fs=False` or with another `spill_dir`, or you can",
+                        "increase the size of `dev/shm` as described here:",
+                        link,
+                        ".",
+                        " Please also remove all files beginning with 'pandarallel_' in",
+                        "the `/dev/shm` directory. If you have troubles with your web",
+                        "browser, these troubles should deseapper after cleaning",
+                        "`/dev/shm`.",
+                    )
+                )
+                raise OSError(msg)
 
-        workers_args = [
-            (
+            yield (
                 input_file.name,
                 output_file.name,
                 index,
                 worker_meta_args,
-                queue,
-                progress_bar == PROGRESS_IN_WORKER,
-                dill.dumps(
-                    progress_wrapper(
-                        progress_bar >= PROGRESS_IN_FUNC, queue, index, chunk_length
-                    )(func)
-                ),
-                args,
-                kwargs,
-            )
-            for index, (input_file, output_file, chunk_length) in enumerate(
-                zip(input_files, output_files, chunk_lengths)
+                generation,
+                progress_bar,
+                call_id,
+                dilled_call,
             )
-        ]
 
-        return workers_args, chunk_lengths, input_files, output_files
+        else:
+            if use_shared_memory:
+                with stats.measure("input_dump"):
+                    chunk, segment = share(chunk)
 
-    else:
-        workers_args, chunk_lengths = zip(
-            *[
-                (
-                    (
-                        chunk,
-                        index,
-                        worker_meta_args,
-                        queue,
-                        progress_bar,
-                        dill.dumps(
-                            progress_wrapper(
-                                progress_bar == PROGRESS_IN_FUNC,
-                                queue,
-                                index,
-                                len(chunk),
-                            )(func)
-                        ),
-                        args,
-                        kwargs,
-                    ),
-                    len(chunk),
-                )
-                for index, chunk in enumerate(chunks)
-            ]
-        )
+                input_files.append(segment)
 
-        return workers_args, chunk_lengths, [], []
+            yield (
+                chunk,
+                index,
+                worker_meta_args,
+                generation,
+                progress_bar,
+                call_id,
+                dilled_call,
+            )
 
 
 def get_workers_result(
     use_memory_fs,
     nb_workers,
+    nb_chunks,
+    first_chunk_index,
     show_progress_bar,
+    progress_bar_per_worker,
     nb_columns,
-    queue,
+    channel,
+    generation,
     chunk_lengths,
     input_files,
     output_files,
-    map_result,
+    async_results,
+    stats,
 ):
-    """Wait for the workers result while eventually display progress bars."""
+    """Wait for the workers result while eventually display progress bars.
+
+    A single progress bar aggregating all chunks is displayed. If
+    `progress_bar_per_worker` is set and there are as many chunks as workers, one
+    progress bar per chunk (so per worker) is displayed instead.
+
+    Progress bars are refreshed every PROGRESS_REFRESH_PERIOD seconds, whatever the
+    rate of messages sent by workers.
+
+    If Memory File System is used, the result of a chunk is loaded as soon as it is
+    available, and its output file is removed at once, so the memory used by output
+    files does not pile up until all workers are done.
+
+    Time spent waiting for workers and loading results, as well as timings sent by
+    workers, are added to `stats`. Chunks are recorded with their index in the whole
+    call, `first_chunk_index` being the index of the first chunk of the wave.
+    """
+    aggregate = not progress_bar_per_worker or nb_chunks > nb_workers
+
     if show_progress_bar:
         if show_progress_bar == PROGRESS_IN_FUNC_MUL:
             chunk_lengths = [
                 chunk_length * (nb_columns + 1) for chunk_length in chunk_lengths
             ]
 
-        progress_bars = get_progress_bars(chunk_lengths)
+        progress_bars = get_progress_bars(
+            [sum(chunk_lengths)] if aggregate else chunk_lengths
+        )
+
+        progresses = [0] * nb_chunks
+
+    def update_progress_bars():
+        # Read progressions published by workers
+        for worker_index, progression in channel.get_progresses():
+            if not finished_workers[worker_index]:
+                progresses[worker_index] = max(progresses[worker_index], progression)
 
-        progresses = [0] * nb_workers
+        progress_bars.update([sum(progresses)] if aggregate else progresses)
 
-    finished_workers = [False] * nb_workers
+    finished_workers = [False] * nb_chunks
+    results = [None] * nb_chunks
 
-    generation = count()
+    next_refresh_time = time() + PROGRESS_REFRESH_PERIOD
 
     while not all(finished_workers):
-        message_type, message = queue.get()
+        with stats.measure("waiting"):
+            message = channel.get(generation, max(next_refresh_time - time(), 0))
+
+        if time() >= next_refresh_time:
+            next_refresh_time = time() + PROGRESS_REFRESH_PERIOD
+
+            if show_progress_bar:
+                update_progress_bars()
+
+            if message is None and all(
+                async_result.ready() for async_result in async_results
+            ):
+                # A task failed before reaching a worker (unpicklable arguments, ...).
+                # `async_result.get` below raises the corresponding exception.
+                break
+
+        if message is None:
+            continue
+
+        message_type, message = message
 
         if message_type is INPUT_FILE_READ:
             file_index = message
             input_files[file_index].close()
 
-        elif message_type is PROGRESSION:
-            worker_index, progression = message
-            progresses[worker_index] = progression
-
-            if next(generation) % nb_workers == 0:
-                progress_bars.update(progresses)
-
         elif message_type is VALUE:
-            worker_index = message
+            worker_index, timings, profile_stats, latency_counts = message
             finished_workers[worker_index] = VALUE
+            stats.add_chunk(
+                first_chunk_index + worker_index, timings, profile_stats, latency_counts
+            )
+
+            if use_memory_fs:
+                output_file = output_files[worker_index]
+
+                with stats.measure("result_load"):
+                    results[worker_index] = mapped_pickle.load(output_file.name)
+
+                output_file.close()
 
             if show_progress_bar:
                 progresses[worker_index] = chunk_lengths[worker_index]
-                progress_bars.update(progresses)
 
         elif message_type is ERROR:
             worker_index = message
             finished_workers[worker_index] = ERROR
 
-            if show_progress_bar:
-                if is_notebook_lab():
-                    progress_bars.set_error(worker_index)
-                progress_bars.update(progresses)
+            if show_progress_bar and is_notebook_lab():
+                progress_bars.set_error(0 if aggregate else worker_index)
+
+            # Raise the exception of the worker at once, without waiting for other
+            # chunks (`process_wave` cancels them)
+            async_results[worker_index].get()
+
+    if show_progress_bar:
+        update_progress_bars()
+
+    # Raise the exception of the first failed worker, if any
+    workers_results = [async_result.get() for async_result in async_results]
+
+    return results if use_memory_fs else workers_results
+
+
+def get_waves(chunks, nb_chunks_per_wave):
+    """Yield chunks by waves of `nb_chunks_per_wave` chunks.
 
-    results = map_result.get()
+    Only chunks of the yielded wave are computed. If `nb_chunks_per_wave` is None, all
+    chunks are yielded as a single wave.
+    """
+    if nb_chunks_per_wave is None:
+        yield chunks
+        return
+
+    chunks = iter(chunks)
+
+    while True:
+        wave = list(islice(chunks, nb_chunks_per_wave))
+
+        if not wave:
+            return
+
+        yield wave
+
+
+def process_wave(
+    use_memory_fs,
+    use_shared_memory,
+    use_persistent_pool,
+    nb_requested_workers,
+    progress_bar,
+    progress_bar_per_worker,
+    nb_columns,
+    pool,
+    channel,
+    worker,
+    chunks,
+    first_chunk_index,
+    worker_meta_args,
+    call_id,
+    dilled_call,
+    spill_dir,
+    profile,
+    collect_latency,
+    stats,
+):
+    """Send `chunks` (the first one being the chunk `first_chunk_index` of the call) to
+    workers of `pool`, and return their results (in chunk order).
 
-    return (
-        [pickle.load(output_files) for output_files in output_files]
-        if use_memory_fs
-        else results
+    This function is run on the MASTER. Once it returns, all files (or shared memory
+    segments) related to `chunks` are removed.
+    """
+    generation = next(generations)
+    channel.open(generation)
+    channel.reset_progresses()
+
+    chunk_lengths, input_files, output_files = [], [], []
+
+    workers_args = get_workers_args(
+        use_memory_fs,
+        use_shared_memory,
+        progress_bar,
+        chunks,
+        worker_meta_args,
+        generation,
+        call_id,
+        dilled_call,
+        chunk_lengths,
+        input_files,
+        output_files,
+        spill_dir,
+        stats,
     )
 
+    if use_persistent_pool:
+        tasks = (
+            (
+                persistent_worker,
+                ((use_memory_fs, profile, collect_latency, worker, worker_args),),
+            )
+            for worker_args in workers_args
+        )
+    else:
+        tasks = ((global_worker, (worker_args,)) for worker_args in workers_args)
+
+    try:
+        async_results = [pool.apply_async(*task) for task in tasks]
+
+        nb_chunks = len(chunk_lengths)
+        nb_workers = min(nb_requested_workers, nb_chunks)
+
+        return get_workers_result(
+            use_memory_fs,
+            nb_workers,
+            nb_chunks,
+            first_chunk_index,
+            progress_bar,
+            progress_bar_per_worker,
+            nb_columns,
+            channel,
+            generation,
+            chunk_lengths,
+            input_files,
+            output_files,
+            async_results,
+            stats,
+        )
+
+    except BaseException:
+        # Tasks already sent keep running, and would write into removed files
+        channel.cancel(generation)
+        raise
+
+    finally:
+        channel.close(generation)
+
+        # Input files (or shared memory segments) & output files
+        for file in input_files + output_files:
+            if file is not None:
+                file.close()
+
+
+def get_decision(
+    nb_requested_workers,
+    use_memory_fs,
+    use_shared_memory,
+    use_inherited_memory,
+    use_persistent_pool,
+    use_threads,
+    get_chunks,
+    worker,
+    data,
+    worker_meta_args,
+    func,
+    args,
+    kwargs,
+):
+    """Time the function on a sample of the data, and return the Decision of running
+    the call serially or in parallel (see `pandarallel.utils.adaptive`).
+
+    With the threads backend, the function is assumed to release the GIL, so to scale
+    with the number of threads.
+
+    This function is run on the MASTER. Return None if the data cannot be sampled.
+    """
+    nb_cells = get_nb_cells(getattr(data, "obj", data))
+
+    if not nb_cells:
+        return None
+
+    chunks = get_chunks(get_nb_sample_chunks(nb_cells), data, *args, **kwargs)
+    sample = next(iter(chunks), None)
+    nb_sample_cells = get_nb_cells(sample)
+
+    if not nb_sample_cells:
+        return None
+
+    func, args, kwargs = resolve_call(func, args, kwargs)
+
+    start = time()
+    worker(sample, 0, worker_meta_args, None, False, func, *args, **kwargs)
+    sample_time = time() - start
+
+    input_rate, output_rate = get_transfer_rates(
+        use_memory_fs, use_shared_memory, use_inherited_memory, use_threads
+    )
+
+    return decide(
+        sample_time,
+        min(nb_sample_cells / nb_cells, 1),
+        get_size(getattr(data, "obj", data)),
+        nb_requested_workers,
+        input_rate,
+        output_rate,
+        # Threads start in a negligible time, as if they already existed
+        use_persistent_pool or use_threads,
+    )
+
+
+def process_serially(get_chunks, worker, data, worker_meta_args, func, args, kwargs):
+    """Process the whole data as a single chunk, and return its result.
+
+    This function is run on the MASTER.
+    """
+    func, args, kwargs = resolve_call(func, args, kwargs)
+    (chunk,) = get_chunks(1, data, *args, **kwargs)
+
+    return worker(chunk, 0, worker_meta_args, None, False, func, *args, **kwargs)
+
 
 def parallelize(
     nb_requested_workers,
@@ -411,6 +898,19 @@ def parallelize(
     reduce,
     get_worker_meta_args=lambda _: dict(),
     get_reduce_meta_args=lambda _: dict(),
+    persistent_pool=None,
+    use_shared_memory=False,
+    use_inherited_memory=False,
+    nb_chunks_per_worker=1,
+    spill_dir=None,
+    max_memory=None,
+    adaptive=False,
+    stats_callback=None,
+    stats_log=None,
+    profile=False,
+    progress_bar_per_worker=False,
+    collect_latency=False,
+    backend=PROCESSES,
 ):
     """Master function.
     1. Split data into chunks
@@ -418,61 +918,408 @@ def parallelize(
     3. Wait for the workers results (while displaying a progress bar if needed)
     4. One results are available, combine them
     5. Return combined results to the user
+
+    If `persistent_pool` is set (and not shut down), its workers and status channel
+    are used. Else, a new pool (and a new status channel) is created for this call only.
+
+    If `use_inherited_memory` is set, workers are created after chunks and get them by
+    inheritance (so `persistent_pool` is ignored).
+
+    Workers created for this call only inherit the function to apply and its arguments.
+    Workers of the persistent pool receive them dilled, through a file written once per
+    call (see `Broadcast`).
+
+    Data is split into `nb_chunks_per_worker` chunks per worker. Chunks are sent one by
+    one to the first available worker, so a worker done with a chunk takes the next
+    one instead of waiting for slower workers.
+
+    Each chunk is sent as soon as it is dumped, so workers start processing first chunks
+    while the MASTER dumps next ones.
+
+    If Memory File System is used, chunks which do not fit in it are dumped into
+    `spill_dir`.
+
+    If `max_memory` is set and data is too big, chunks are processed by waves (see
+    `get_waves`), so only chunks of the current wave are in memory at once.
+
+    If `adaptive` is set, the call is either run serially in the MASTER (without
+    progress bar), or in parallel with the number of workers minimizing its estimated
+    wall time (see `get_decision`).
+
+    The time spent in each phase of the call is recorded into a Stats object, which is
+    passed to `stats_callback` and appended to the JSON lines file at `stats_log` (if
+    set).
+
+    If `profile` is set, workers profile the processing of each chunk, and profiles are
+    merged into the Stats of the call.
+
+    If `collect_latency` is set, workers record the duration of each call of the
+    function to apply, and latency histograms are merged into the Stats of the call.
+
+    With the THREADS `backend` (which can be overridden per call), workers are threads
+    of the MASTER, created for this call only. Chunks, the function to apply and results
+    are shared with them as is, without any serialization (so transports and
+    `persistent_pool` are ignored).
     """
 
-    def closure(data, func, *args, **kwargs):
-        chunks = get_chunks(nb_requested_workers, data, *args, **kwargs)
-        nb_columns = len(data.columns) if progress_bar == PROGRESS_IN_FUNC_MUL else None
+    def process(
+        stats,
+        use_threads,
+        use_memory_fs,
+        use_shared_memory,
+        use_inherited_memory,
+        data,
+        func,
+        *args,
+        **kwargs
+    ):
+        global last_decision
+
+        use_persistent_pool = (
+            persistent_pool is not None
+            and persistent_pool.is_alive
+            and not use_inherited_memory
+            and not use_threads
+        )
+
+        nb_workers = nb_requested_workers
         worker_meta_args = get_worker_meta_args(data)
         reduce_meta_args = get_reduce_meta_args(data)
-        manager = context.Manager()
-        queue = manager.Queue()
 
-        workers_args, chunk_lengths, input_files, output_files = get_workers_args(
-            use_memory_fs,
-            nb_requested_workers,
-            progress_bar,
-            chunks,
-            worker_meta_args,
-            queue,
+        if adaptive:
+            with stats.measure("sampling"):
+                last_decision = get_decision(
+                    nb_requested_workers,
+                    use_memory_fs,
+                    use_shared_memory,
+                    use_inherited_memory,
+                    use_persistent_pool,
+                    use_threads,
+                    get_chunks,
+                    worker,
+                    data,
+                    worker_meta_args,
+                    func,
+                    args,
+                    kwargs,
+                )
+
+            if last_decision is not None and last_decision.is_serial:
+                with stats.measure("serial"):
+                    result = process_serially(
+                        get_chunks, worker, data, worker_meta_args, func, args, kwargs
+                    )
+
+                with stats.measure("reduce"):
+                    return reduce([result], reduce_meta_args)
+
+            if last_decision is not None:
+                nb_workers = last_decision.nb_workers
+
+        nb_requested_chunks = nb_workers * nb_chunks_per_worker
+        nb_chunks_per_wave = None
+
+        if max_memory is not None:
+            # A chunk is in memory (in the MASTER, in Memory File System or in a
+            # worker) together with its result, estimated to be as big as the chunk
+            data_size = get_size(getattr(data, "obj", data))
+            nb_waves = -(-2 * data_size // max_memory)
+
+            if nb_waves > 1:
+                nb_chunks_per_wave = nb_requested_chunks
+                nb_requested_chunks *= nb_waves
+
+        chunks = get_chunks(nb_requested_chunks, data, *args, **kwargs)
+
+        if use_inherited_memory:
+            with stats.measure("chunking"):
+                inherited_chunks = list(chunks)
+
+            chunks = [
+                InheritedChunk(index, len(chunk))
+                for index, chunk in enumerate(inherited_chunks)
+            ]
+        else:
+            inherited_chunks = None
+
+        nb_columns = len(data.columns) if progress_bar == PROGRESS_IN_FUNC_MUL else None
+
+        if use_persistent_pool:
+            channel = persistent_pool.channel
+        else:
+            channel = StatusChannel(context, nb_workers)
+
+        # Functions defined in the main module (lambda functions, ...) can only be
+        # pickled with dill
+        call = func, args, kwargs
+        call_id = next(call_ids)
+
+        if use_persistent_pool:
+            # Sent once, whatever the number of chunks
+            with stats.measure("serialization"):
+                dilled_call = Broadcast(dill.dumps(call), spill_dir)
+
+            pool = persistent_pool.pool
+        else:
+            dilled_call = None
+
+            # Workers of the threads backend are threads of the MASTER
+            create_pool = ThreadPool if use_threads else context.Pool
+
+            with stats.measure("pool_startup"):
+                pool = create_pool(
+                    nb_workers,
+                    worker_init,
+                    (
+                        prepare_worker(use_memory_fs, profile, collect_latency)(worker),
+                        channel,
+                        inherited_chunks,
+                        call,
+                    ),
+                )
+
+        results = []
+
+        try:
+            for wave in get_waves(chunks, nb_chunks_per_wave):
+                results += process_wave(
+                    use_memory_fs,
+                    use_shared_memory,
+                    use_persistent_pool,
+                    nb_workers,
+                    progress_bar,
+                    progress_bar_per_worker,
+                    nb_columns,
+                    pool,
+                    channel,
+                    worker,
+                    wave,
+                    len(results),
+                    worker_meta_args,
+                    call_id,
+                    dilled_call,
+                    spill_dir,
+                    profile,
+                    collect_latency,
+                    stats,
+                )
+
+        except BaseException as exception:
+            if not use_persistent_pool:
+                stop_pool(pool, exception)
+            raise
+
+        finally:
+            if dilled_call is not None:
+                dilled_call.close()
+
+        if not use_persistent_pool:
+            pool.close()
+
+        with stats.measure("reduce"):
+            return reduce(results, reduce_meta_args)
+
+    def closure(data, func, *args, backend=backend, **kwargs):
+        global last_stats
+
+        check_backend(backend, profile)
+        use_threads = backend == THREADS
+
+        stats = Stats()
+        start = time()
+
+        # Threads share the memory of the MASTER, so nothing is transferred
+        result = process(
+            stats,
+            use_threads,
+            use_memory_fs and not use_threads,
+            use_shared_memory and not use_threads,
+            use_inherited_memory and not use_threads,
+            data,
             func,
-            args,
-            kwargs,
+            *args,
+            **kwargs
         )
 
-        nb_workers = len(chunk_lengths)
+        stats.total = time() - start
+        last_stats = stats
+        emit(stats, stats_callback, stats_log)
+
+        return result
+
+    return closure
+
+
+def stream(
+    nb_requested_workers,
+    use_memory_fs,
+    use_shared_memory=False,
+    persistent_pool=None,
+    spill_dir=None,
+):
+    """Master function of `pandarallel.imap`.
+
+    Items of the iterable are sent to workers as chunks, with the same transports as
+    `parallelize`. At most `prefetch` items are pulled from the iterable and not yet
+    yielded back (as results) at once.
+
+    If `persistent_pool` is set (and not shut down), its workers and status channel
+    are used. Else, a new pool (and a new status channel) is created for this iteration
+    only.
+    """
+
+    def closure(func, iterable, ordered, prefetch, *args, **kwargs):
+        use_persistent_pool = persistent_pool is not None and persistent_pool.is_alive
+        prefetch = prefetch or 2 * nb_requested_workers
+
+        generation = next(generations)
+        call = func, args, kwargs
+        call_id = next(call_ids)
+
+        if use_persistent_pool:
+            pool, channel = persistent_pool.pool, persistent_pool.channel
+            dilled_call = Broadcast(dill.dumps(call), spill_dir)
+        else:
+            channel = StatusChannel(context, nb_requested_workers)
+            dilled_call = None
 
-        try:
             pool = context.Pool(
-                nb_workers, worker_init, (prepare_worker(use_memory_fs)(worker),),
+                nb_requested_workers,
+                worker_init,
+                (prepare_worker(use_memory_fs)(Frames.worker), channel, None, call),
             )
 
-            map_result = pool.map_async(global_worker, workers_args)
-            pool.close()
+        chunk_lengths, input_files, output_files = [], [], []
 
-            results = get_workers_result(
-                use_memory_fs,
-                nb_workers,
-                progress_bar,
-                nb_columns,
-                queue,
-                chunk_lengths,
-                input_files,
-                output_files,
-                map_result,
-            )
+        workers_args = get_workers_args(
+            use_memory_fs,
+            use_shared_memory,
+            NO_PROGRESS,
+            iterable,
+            dict(),
+            generation,
+            call_id,
+            dilled_call,
+            chunk_lengths,
+            input_files,
+            output_files,
+            spill_dir,
+            Stats(),
+        )
 
-            return reduce(results, reduce_meta_args)
+        # Index of chunk -> AsyncResult, for chunks sent to workers and not finished
+        async_results = dict()
+
+        # Index of chunk -> result, for finished chunks not yielded yet
+        results = dict()
+
+        next_index = 0
+
+        def submit():
+            """Send the next item to workers. Return False if there is no more item."""
+            worker_args = next(workers_args, None)
+
+            if worker_args is None:
+                return False
+
+            index = len(chunk_lengths) - 1
+
+            if use_persistent_pool:
+                task = (
+                    persistent_worker,
+                    ((use_memory_fs, False, False, Frames.worker, worker_args),),
+                )
+            else:
+                task = global_worker, (worker_args,)
+
+            async_results[index] = pool.apply_async(*task)
+            return True
+
+        def complete(index):
+            """Move the result of the chunk `index` (which has to be finished, or about
+            to be) to `results`, or raise the exception of its worker."""
+            result = async_results.pop(index).get()
 
-        finally:
             if use_memory_fs:
-                for file in input_files + output_files:
+                result = mapped_pickle.load(output_files[index].name)
+                output_files[index].close()
+
+            results[index] = result
+
+        channel.open(generation)
+
+        try:
+            is_exhausted = False
+
+            while True:
+                while not is_exhausted and len(async_results) + len(results) < prefetch:
+                    is_exhausted = not submit()
+
+                if ordered:
+                    while next_index in results:
+                        yield results.pop(next_index)
+                        next_index += 1
+                else:
+                    for index in list(results):
+                        yield results.pop(index)
+
+                if is_exhausted and not async_results and not results:
+                    return
+
+                message = channel.get(generation, PROGRESS_REFRESH_PERIOD)
+
+                if message is not None:
+                    message_type, message = message
+
+                    # VALUE messages also hold timings, profile and latency histogram
+                    # (see `prepare_worker`)
+                    index = message[0] if message_type is VALUE else message
+
+                    if message_type is INPUT_FILE_READ:
+                        input_files[index].close()
+
+                    elif index in async_results:
+                        # VALUE or ERROR (whose exception is raised)
+                        complete(index)
+
+                # A finished task is a finished chunk, even without its VALUE message
+                # (and a task may fail before reaching a worker)
+                for index in [
+                    index
+                    for index, async_result in async_results.items()
+                    if async_result.ready()
+                ]:
+                    complete(index)
+
+        except BaseException as exception:
+            # Including an iteration stopped before the end (GeneratorExit)
+            channel.cancel(generation)
+
+            if not use_persistent_pool:
+                stop_pool(pool, exception)
+            raise
+
+        finally:
+            channel.close(generation)
+
+            if use_persistent_pool:
+                dilled_call.close()
+            else:
+                pool.close()
+
+            # Input files (or shared memory segments) & output files
+            for file in input_files + output_files:
+                if file is not None:
                     file.close()
 
     return closure
 
 
 class pandarallel:
+    __persistent_pool = None
+    __stream = None
+    __spill_dir = None
+
     @classmethod
     def initialize(
         cls,
@@ -481,6 +1328,20 @@ class pandarallel:
         progress_bar=False,
         verbose=2,
         use_memory_fs=None,
+        persistent_pool=False,
+        use_shared_memory=False,
+        use_inherited_memory=False,
+        nb_chunks_per_worker=1,
+        group_cost=None,
+        spill_dir=None,
+        max_memory=None,
+        adaptive=False,
+        stats_callback=None,
+        stats_log=None,
+        profile=False,
+        progress_bar_per_worker=False,
+        collect_latency=False,
+        backend=PROCESSES,
     ):
         """
         Initialize Pandarallel shared memory.
@@ -525,10 +1386,162 @@ class pandarallel:
 
             Basicaly memory file system is only available on some Linux
             distributions (including Ubuntu)
+
+        persistent_pool: bool, optional
+            If set to False (default), workers are created (and destroyed) at each
+            `parallel_*` call.
+
+            If set to True, workers are created once by this function and reused by
+            every `parallel_*` call, which removes the workers creation cost from each
+            call. Workers are stopped by `pandarallel.shutdown`, by a new call to
+            `pandarallel.initialize`, or at the end of a `with` block if the returned
+            pool is used as a context manager:
+
+            with pandarallel.initialize(persistent_pool=True):
+                df.parallel_apply(func)
+
+        use_shared_memory: bool, optional
+            If set to True, numeric values of DataFrames and Series are transferred
+            from the main process to workers through shared memory: Workers use them
+            directly, without any copy. Only indexes and non numeric values are
+            pickled. Results are transferred back with multiprocessing data transfer
+            (pipe). Chunks which are neither DataFrames nor Series (groupby) are
+            pickled as usual.
+
+            Shared memory is only available with Python >= 3.8. If set to True while
+            shared memory is not available, a SystemError is raised. `use_memory_fs`
+            and `use_shared_memory` cannot be both set to True.
+
+        use_inherited_memory: bool, optional
+            If set to True, workers are created (by fork) once data to process is
+            split into chunks, and read their chunk directly in the memory they
+            inherited from the main process. Data is neither pickled nor copied (except
+            the parts written by the function to apply, because of copy-on-write).
+            Results are transferred back with multiprocessing data transfer (pipe).
+
+            Workers have to be created at each call, so `use_inherited_memory` cannot
+            be used together with `persistent_pool`, `use_memory_fs` or
+            `use_shared_memory`.
+
+        nb_chunks_per_worker: int, optional
+            Number of chunks data is split into, per worker. If set to 1 (default),
+            each worker processes exactly one chunk.
+
+            If set to a greater value, chunks are dispatched dynamically: each worker
+            takes a new chunk as soon as it is done with the previous one. It balances
+            the load between workers when the cost of the function to apply varies a
+            lot from a row (or a group) to another, at the price of a higher
+            communication cost. A single progress bar, aggregating all chunks, is
+            then displayed.
+
+        group_cost: function, optional
+            Function estimating the cost of applying a function to a group with
+            `DataFrameGroupBy.parallel_apply`, given its number of rows. Groups are
+            assigned to chunks so all chunks have approximatively the same total cost.
+            If not set, the cost of a group is its number of rows. For example, if
+            the function to apply is quadratic in the number of rows:
+
+            pandarallel.initialize(group_cost=lambda nb_rows: nb_rows ** 2)
+
+        spill_dir: str, optional
+            Only used with memory file system (and by `pandarallel.broadcast`). Chunks
+            (and their results) which do not fit in memory file system (because of its
+            free space, or because of the memory limit of the cgroup) are written in
+            this directory instead. So are broadcasted objects. If not set, the default
+            temporary directory is used. Files are read through memory mapping, so the
+            page cache is used as much as possible.
+
+        max_memory: int, optional
+            Memory budget (in bytes) for data being processed. If the data to process
+            (and its result, estimated to be as big) does not fit in this budget, it is
+            split into more chunks, processed by waves: a wave is only dumped once the
+            previous one is done, and its files are removed before the next one
+            starts. Progress bars are displayed for each wave. Results of all waves
+            are combined at the end, so they still have to fit in memory.
+
+        adaptive: bool, optional
+            If set to True, the function to apply is first timed on a small sample of
+            the data (about 1%, but at least 1000 cells) in the MASTER. Each call is
+            then run serially (if parallelization is estimated not to pay off, e.g. for
+            small data) or with the number of workers minimizing its estimated wall
+            time, given the transfer cost of the data with the selected transport. The
+            function is called twice on the sample, and serial calls display no
+            progress bar. The decision of the last call is returned by
+            `pandarallel.last_decision`.
+
+        stats_callback: function, optional
+            Function called with the Stats (see `pandarallel.utils.stats`) of each
+            `parallel_*` call: the time spent in each phase run on the MASTER
+            (chunking, serialization, pool startup, input dump, waiting, result load,
+            reduce), and for each chunk, the time spent by its worker to load it,
+            to apply the function and to dump the result. The Stats of the last call
+            are also returned by `pandarallel.last_stats`.
+
+        stats_log: str, optional
+            Path of a file the Stats of each `parallel_*` call are appended to, as
+            JSON lines.
+
+        profile: bool, optional
+            If set to True, workers run the processing of each chunk (loading, function
+            application and dump of the result) under cProfile. Profiles of all chunks
+            of a `parallel_*` call are merged into a single `pstats.Stats` object, set
+            as the `profile` attribute of the Stats of the call (see `stats_callback`
+            and `pandarallel.last_stats`). Chunks sent through pipes are unpickled
+            before the profiled part. With Python >= 3.12, it cannot be used with the
+            threads backend (a ValueError is raised).
+
+        progress_bar_per_worker: bool, optional
+            If set to True (and if there are as many chunks as workers), one progress
+            bar per worker is displayed. Else, a single progress bar aggregating all
+            workers, with the throughput and the estimated time left, is displayed.
+
+        collect_latency: bool, optional
+            If set to True, workers record the duration of each call of the function to
+            apply (so of each row or each group, depending on the method) into a
+            histogram with log-scale buckets. Histograms of all chunks of a
+            `parallel_*` call are merged into a single LatencyHistogram, set as the
+            `latency` attribute of the Stats of the call (see `stats_callback` and
+            `pandarallel.last_stats`).
+
+        backend: str, optional
+            "processes" (default) to run workers in processes forked from the main
+            process, or "threads" to run them in threads of the main process. Threads
+            receive data, the function to apply and its arguments as is, without any
+            serialization (so transports and `persistent_pool` are not used), but
+            only functions releasing the GIL (NumPy, regex, compression, I/O, ...)
+            run in parallel. It can be overridden per call with the `backend` keyword
+            argument of `parallel_*` methods (which is not passed to the function).
+
+        Returns
+        -------
+        The persistent pool if `persistent_pool` is set to True, else None.
         """
 
+        if nb_chunks_per_worker < 1:
+            raise ValueError("`nb_chunks_per_worker` must be at least 1")
+
+        check_backend(backend, profile)
+
+        if use_memory_fs and use_shared_memory:
+            raise ValueError(
+                "`use_memory_fs` and `use_shared_memory` cannot be both set to True"
+            )
+
+        if use_inherited_memory and (
+            use_memory_fs or use_shared_memory or persistent_pool
+        ):
+            raise ValueError(
+                "`use_inherited_memory` cannot be used together with `use_memory_fs`, "
+                "`use_shared_memory` or `persistent_pool`"
+            )
+
         memory_fs_available = is_memory_fs_available()
-        use_memory_fs = use_memory_fs or use_memory_fs is None and memory_fs_available
+        use_memory_fs = use_memory_fs or (
+            use_memory_fs is None
+            and memory_fs_available
+            and not use_shared_memory
+            and not use_inherited_memory
+        )
 
         if shm_size_mb:
             print(
@@ -539,15 +1552,36 @@ class pandarallel:
         if use_memory_fs and not memory_fs_available:
             raise SystemError("Memory file system is not available")
 
+        if use_shared_memory and not is_shared_memory_available():
+            raise SystemError("Shared memory is not available (Python >= 3.8 required)")
+
         if verbose >= 2:
             print("INFO: Pandarallel will run on", nb_workers, "workers.")
 
-            if use_memory_fs:
+            if backend == THREADS:
+                print(
+                    "INFO: Pandarallel workers will be threads of the main process,",
+                    "sharing its memory (unless `backend` is set for a call).",
+                    sep=" ",
+                )
+            elif use_memory_fs:
                 print(
                     "INFO: Pandarallel will use Memory file system to transfer data",
                     "between the main process and workers.",
                     sep=" ",
                 )
+            elif use_shared_memory:
+                print(
+                    "INFO: Pandarallel will use shared memory to transfer data from",
+                    "the main process to workers.",
+                    sep=" ",
+                )
+            elif use_inherited_memory:
+                print(
+                    "INFO: Pandarallel workers will read data in the memory they",
+                    "inherit from the main process.",
+                    sep=" ",
+                )
             else:
                 print(
                     "INFO: Pandarallel will use standard multiprocessing data transfer",
@@ -556,6 +1590,19 @@ class pandarallel:
                     sep=" ",
                 )
 
+            if persistent_pool:
+                print("INFO: Pandarallel will reuse the same workers for each call.")
+
+        cls.shutdown()
+
+        if use_shared_memory:
+            start_resource_tracker()
+
+        if persistent_pool:
+            cls.__persistent_pool = PersistentPool(nb_workers)
+
+        cls.__spill_dir = spill_dir
+
         nbw = nb_workers
 
         progress_in_func = PROGRESS_IN_FUNC * progress_bar
@@ -567,41 +1614,154 @@ class pandarallel:
 
         bargs_prog_worker = (nbw, use_memory_fs, progress_in_worker)
 
+        bkwargs = dict(
+            persistent_pool=cls.__persistent_pool,
+            use_shared_memory=use_shared_memory,
+            use_inherited_memory=use_inherited_memory,
+            nb_chunks_per_worker=nb_chunks_per_worker,
+            spill_dir=spill_dir,
+            max_memory=max_memory,
+            adaptive=adaptive,
+            stats_callback=stats_callback,
+            stats_log=stats_log,
+            profile=profile,
+            progress_bar_per_worker=progress_bar_per_worker,
+            collect_latency=collect_latency,
+            backend=backend,
+        )
+
         # DataFrame
         args = bargs_prog_func + (DF.Apply.get_chunks, DF.Apply.worker, DF.reduce)
-        DataFrame.parallel_apply = parallelize(*args)
+        DataFrame.parallel_apply = parallelize(*args, **bkwargs)
 
-        args = bargs_prog_func_mul + (
-            DF.ApplyMap.get_chunks,
-            DF.ApplyMap.worker,
-            DF.reduce,
-        )
+        args = bargs_prog_func_mul + (DF.get_chunks, DF.ApplyMap.worker, DF.reduce)
 
-        DataFrame.parallel_applymap = parallelize(*args)
+        DataFrame.parallel_applymap = parallelize(*args, **bkwargs)
+
+        # Progress bars are updated once a whole chunk is processed
+        args = bargs_prog_worker + (DF.get_chunks, DF.MapPartitions.worker, DF.reduce)
+
+        DataFrame.parallel_map_partitions = parallelize(*args, **bkwargs)
 
         # Series
         args = bargs_prog_func + (S.get_chunks, S.Apply.worker, S.reduce)
-        Series.parallel_apply = parallelize(*args)
+        Series.parallel_apply = parallelize(*args, **bkwargs)
 
         args = bargs_prog_func + (S.get_chunks, S.Map.worker, S.reduce)
-        Series.parallel_map = parallelize(*args)
+        Series.parallel_map = parallelize(*args, **bkwargs)
+
+        args = bargs_prog_worker + (S.get_chunks, S.MapPartitions.worker, S.reduce)
+        Series.parallel_map_partitions = parallelize(*args, **bkwargs)
 
         # Series Rolling
         args = bargs_prog_func + (SR.get_chunks, SR.worker, SR.reduce)
         kwargs = dict(get_worker_meta_args=SR.att2value)
-        Rolling.parallel_apply = parallelize(*args, **kwargs)
+        Rolling.parallel_apply = parallelize(*args, **kwargs, **bkwargs)
 
         # DataFrame GroupBy
-        args = bargs_prog_func + (DFGB.get_chunks, DFGB.worker, DFGB.reduce)
+        args = bargs_prog_func + (DFGB.get_chunks(group_cost), DFGB.worker, DFGB.reduce)
         kwargs = dict(get_reduce_meta_args=DFGB.get_reduce_meta_args)
-        DataFrameGroupBy.parallel_apply = parallelize(*args, **kwargs)
+        DataFrameGroupBy.parallel_apply = parallelize(*args, **kwargs, **bkwargs)
 
         # Rolling GroupBy
         args = bargs_prog_worker + (RGB.get_chunks, RGB.worker, RGB.reduce)
         kwargs = dict(get_worker_meta_args=RGB.att2value)
-        RollingGroupby.parallel_apply = parallelize(*args, **kwargs)
+        RollingGroupby.parallel_apply = parallelize(*args, **kwargs, **bkwargs)
 
         # Expanding GroupBy
         args = bargs_prog_worker + (EGB.get_chunks, EGB.worker, EGB.reduce)
         kwargs = dict(get_worker_meta_args=EGB.att2value)
-        ExpandingGroupby.parallel_apply = parallelize(*args, **kwargs)
+        ExpandingGroupby.parallel_apply = parallelize(*args, **kwargs, **bkwargs)
+
+        cls.__stream = stream(
+            nb_workers,
+            use_memory_fs,
+            use_shared_memory=use_shared_memory,
+            persistent_pool=cls.__persistent_pool,
+            spill_dir=spill_dir,
+        )
+
+        return cls.__persistent_pool
+
+    @classmethod
+    def imap(cls, func, iterable, *args, ordered=True, prefetch=None, **kwargs):
+        """Apply `func` to each item (DataFrame, Series, ...) of `iterable` in workers,
+        and yield results.
+
+        Items are pulled from `iterable` only when needed, so it can be a stream of
+        chunks which would not fit in memory together (`pd.read_csv(chunksize=...)`,
+        ...).
+
+        Parameters
+        ----------
+        func: function
+            Function to apply to each item, as `func(item, *args, **kwargs)`
+
+        iterable: iterable
+            Items to process
+
+        ordered: bool, optional
+            If set to True (default), results are yielded in the order of items.
+            Else, results are yielded as soon as they are available.
+
+        prefetch: int, optional
+            Maximum number of items pulled from `iterable` whose result is not yielded
+            yet. If not set, twice the number of workers.
+
+        Items are transferred to workers as set by `pandarallel.initialize` (which has
+        to be called first), and the persistent pool is used if any.
+        """
+        if cls.__stream is None:
+            raise RuntimeError("`pandarallel.initialize` has to be called first")
+
+        return cls.__stream(func, iterable, ordered, prefetch, *args, **kwargs)
+
+    @classmethod
+    def broadcast(cls, obj):
+        """Send `obj` once to all workers.
+
+        Arguments of a `parallel_*` call are pickled at each call, and loaded by each
+        worker, if the persistent pool is used. If an argument (or the function to
+        apply, like the mapper of `Series.parallel_map`) is big, wrap it with this
+        function: Workers then receive only a handle, and load the object only once,
+        even across calls.
+
+        mapper = pandarallel.broadcast(big_dict)
+        series.parallel_map(mapper)
+
+        The object is held in a file (in Memory File System if it has enough free
+        space, else in `spill_dir`), removed by `close` on the returned handle, at the
+        end of a `with` block, or once the handle is garbage collected. Workers map
+        NumPy arrays, Series and DataFrames held by the object read-only, instead of
+        copying them.
+        """
+        return Broadcast(obj, cls.__spill_dir)
+
+    @staticmethod
+    def last_decision():
+        """Return the Decision (see `pandarallel.utils.adaptive`) of the last call made
+        with `adaptive`, or None if there is none (or if its data could not be
+        sampled).
+
+        A Decision exposes the number of workers chosen (`nb_workers`, 0 for a serial
+        execution), and the estimates it is based on (`serial_time`, `parallel_times`
+        by number of workers, ...).
+        """
+        return last_decision
+
+    @staticmethod
+    def last_stats():
+        """Return the Stats (see `pandarallel.utils.stats`) of the last `parallel_*`
+        call, or None if there is none."""
+        return last_stats
+
+    @classmethod
+    def shutdown(cls):
+        """Stop workers of the persistent pool, if any.
+
+        Once the persistent pool is shut down, each `parallel_*` call creates its own
+        workers again.
+        """
+        if cls.__persistent_pool is not None:
+            cls.__persistent_pool.shutdown()
+            cls.__persistent_pool = None
@@ -0,0 +1,187 @@
+"""Choice between a serial and a parallel execution of a call, from estimated costs.
+
+The MASTER times the function on a small sample of the data, and extrapolates this time
+to the whole data (serial time). The wall time of a parallel execution with `n`
+workers is estimated as:
+- the fixed cost of a parallel call (plus the cost of creating `n` workers, if the
+  pool is created for this call only),
+- plus the time needed to transfer the data to workers and their results back to the
+  MASTER, estimated from the size of the data and the selected transport (results are
+  assumed to be as big as the data),
+- plus the serial time divided by `n`.
+
+The execution (serial, or parallel with `n` workers) with the lowest estimated wall
+time is chosen.
+"""
+
+import pandas as pd
+
+from pandarallel.utils.groups import GroupsChunk
+
+# Fixed cost (in seconds) of a parallel call (status channel, messages, ...)
+CALL_OVERHEAD = 0.005
+
+# Cost (in seconds) of creating a worker, if the pool is created for the call only
+WORKER_START_TIME = 0.008
+
+# Estimated transfer rates (in bytes per second) of transports
+MEMORY_FS_RATE = 1e9
+PIPE_RATE = 3e8
+SHARED_MEMORY_RATE = 2e9
+
+# The function is timed on about 1 / NB_SAMPLE_CHUNKS of the data, but on at least
+# MIN_SAMPLE_CELLS cells (if available), so the fixed cost of a call to the function
+# (e.g. `Series.apply`) does not dominate the sample time
+NB_SAMPLE_CHUNKS = 100
+MIN_SAMPLE_CELLS = 1000
+
+
+class Decision:
+    """Execution chosen for a call, with the estimates it is based on.
+
+    - `nb_workers`: Number of workers chosen, 0 meaning a serial execution in the
+      MASTER
+    - `serial_time`: Estimated wall time (in seconds) of a serial execution
+    - `parallel_times`: Estimated wall time (in seconds) of a parallel execution, by
+      number of workers
+    - `sample_time`: Time (in seconds) taken by the function on the sample
+    - `sample_fraction`: Fraction of the data in the sample
+    - `data_size`: Estimated size (in bytes) of the data
+    """
+
+    def __init__(
+        self,
+        nb_workers,
+        serial_time,
+        parallel_times,
+        sample_time,
+        sample_fraction,
+        data_size,
+    ):
+        self.nb_workers = nb_workers
+        self.serial_time = serial_time
+        self.parallel_times = parallel_times
+        self.sample_time = sample_time
+        self.sample_fraction = sample_fraction
+        self.data_size = data_size
+
+    @property
+    def is_serial(self):
+        return self.nb_workers == 0
+
+    def __repr__(self):
+        execution = (
+            "serial"
+            if self.is_serial
+            else "parallel with {} workers".format(self.nb_workers)
+        )
+
+        estimated_time = (
+            self.serial_time if self.is_serial else self.parallel_times[self.nb_workers]
+        )
+
+        return "<Decision: {} (estimated time: {:.3f} s)>".format(
+            execution, estimated_time
+        )
+
+
+def get_nb_cells(data):
+    """Return the number of cells of `data` (a DataFrame, a Series or a chunk of
+    groups), or None for other objects."""
+    if isinstance(data, GroupsChunk):
+        data = data.data
+
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        return data.size
+
+    return None
+
+
+def get_nb_sample_chunks(nb_cells):
+    """Return the number of chunks data of `nb_cells` cells is split into, the first
+    one being the sample."""
+    return max(1, min(NB_SAMPLE_CHUNKS, nb_cells // MIN_SAMPLE_CELLS))
+
+
+def get_transfer_rates(
+    use_memory_fs, use_shared_memory, use_inherited_memory, use_threads=False
+):
+    """Return the estimated transfer rates (in bytes per second) of the data to
+    workers, and of the results back to the MASTER.
+
+    The rate of inherited data is None, since it is not transferred at all. With
+    threads, nothing is transferred, so both rates are None.
+    """
+    if use_threads:
+        return None, None
+
+    output_rate = MEMORY_FS_RATE if use_memory_fs else PIPE_RATE
+
+    if use_inherited_memory:
+        return None, output_rate
+
+    if use_shared_memory:
+        return SHARED_MEMORY_RATE, output_rate
+
+    return output_rate, output_rate
+
+
+def decide(
+    sample_time,
+    sample_fraction,
+    data_size,
+    max_nb_workers,
+    input_rate,
+    output_rate,
+    is_pool_started,
+):
+    """Return the Decision minimizing the estimated wall time of a call.
+
+    Parameters
+    ----------
+    sample_time: float
+        Time (in seconds) taken by the function on the sample
+
+    sample_fraction: float
+        Fraction of the data in the sample
+
+    data_size: int
+        Estimated size (in bytes) of the data
+
+    max_nb_workers: int
+        Maximum number of workers
+
+    input_rate, output_rate: float
+        Transfer rates (in bytes per second) of the data to workers, and of the results
+        back to the MASTER (None if not transferred)
+
+    is_pool_started: bool
+        True if workers already exist (persistent pool)
+    """
+    serial_time = sample_time / sample_fraction
+
+    transfer_time = sum(
+        data_size / rate for rate in (input_rate, output_rate) if rate is not None
+    )
+
+    parallel_times = {
+        nb_workers: CALL_OVERHEAD
+        + (0 if is_pool_started else WORKER_START_TIME * nb_workers)
+        + transfer_time
+        + serial_time / nb_workers
+        for nb_workers in range(1, max_nb_workers + 1)
+    }
+
+    nb_workers = min(parallel_times, key=parallel_times.get)
+
+    if serial_time <= parallel_times[nb_workers]:
+        nb_workers = 0
+
+    return Decision(
+        nb_workers,
+        serial_time,
+        parallel_times,
+        sample_time,
+        sample_fraction,
+        data_size,
+    )
@@ -0,0 +1,126 @@
+"""Objects sent once to all workers, whatever the number of chunks and calls.
+
+The MASTER pickles the object once into a file (in Memory File System if it has enough
+free space, else in the spill directory). A Broadcast is pickled as the path of this
+file only, and each worker loads the object once, the first time it needs it.
+
+Files are written with `mapped_pickle`, and loaded read-only: buffers of the object
+(values of NumPy arrays, Series, DataFrames, ...) are mapped by workers instead of
+being copied, so all workers share the same memory.
+"""
+
+import os
+import weakref
+from tempfile import mkstemp
+
+from pandarallel.utils import mapped_pickle
+from pandarallel.utils.memory import dump_with_spill
+
+PREFIX = "pandarallel_broadcast_"
+SUFFIX = ".pickle"
+
+# Objects loaded by this worker, by path
+loaded_values = dict()
+
+
+class Broadcast:
+    """Handle of an object sent once to all workers.
+
+    In workers, the object is available with `value`. The file holding the object is
+    removed by `close`, at the end of a `with` block, or once the handle is garbage
+    collected in the MASTER.
+
+    The file is created in Memory File System, or in `spill_dir` if there is not
+    enough free space (see `dump_with_spill`).
+    """
+
+    def __init__(self, value, spill_dir=None):
+        self.path = dump_with_spill(
+            value, lambda directory: dump(value, directory), spill_dir
+        )
+        self.__value = value
+        self.__finalizer = weakref.finalize(self, remove, self.path)
+
+    @property
+    def value(self):
+        return self.__value
+
+    def close(self):
+        """Remove the file holding the object. Runs on the MASTER."""
+        self.__finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __reduce__(self):
+        return LoadedBroadcast, (self.path,)
+
+
+class LoadedBroadcast:
+    """Broadcast as received by workers."""
+
+    def __init__(self, path):
+        self.path = path
+
+    @property
+    def value(self):
+        return load(self.path)
+
+    def load_once(self):
+        """Return the object, without keeping it loaded in this worker (for objects
+        the caller keeps itself)."""
+        return mapped_pickle.load(self.path, read_only=True)
+
+
+def dump(value, directory):
+    """Pickle `value` into a new file in `directory`, and return its path."""
+    file_descriptor, path = mkstemp(SUFFIX, PREFIX, directory)
+    os.close(file_descriptor)
+
+    try:
+        mapped_pickle.dump(value, path)
+    except OSError:
+        remove(path)
+        raise
+
+    return path
+
+
+def remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def load(path):
+    """Return the object held by the file at `path`. Runs on WORKERS.
+
+    The object is loaded only once per worker, read-only. Objects whose file was
+    removed in the meantime are forgotten.
+    """
+    if path not in loaded_values:
+        for loaded_path in list(loaded_values):
+            if not os.path.exists(loaded_path):
+                del loaded_values[loaded_path]
+
+        loaded_values[path] = mapped_pickle.load(path, read_only=True)
+
+    return loaded_values[path]
+
+
+def resolve(item):
+    """Return the broadcasted object if `item` is a Broadcast, else `item`.
+
+    Tuples (like `args` of `Series.apply`) are resolved item by item.
+    """
+    if isinstance(item, (Broadcast, LoadedBroadcast)):
+        return item.value
+
+    if type(item) is tuple:
+        return tuple(resolve(sub_item) for sub_item in item)
+
+    return item
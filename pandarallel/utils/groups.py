@@ -0,0 +1,88 @@
+"""Split groups of a GroupBy into chunks without materializing each group.
+
+Iterating over a GroupBy builds one DataFrame per group, which is costly (in CPU and
+memory) for the MASTER when there are many small groups, and each of these DataFrames
+is then pickled separately. Instead, rows of the groups of a chunk are taken at once
+(in group order), and the worker cuts groups itself, as views, thanks to group
+lengths.
+"""
+
+import numpy as np
+
+
+class Groups:
+    """Layout of the groups of a GroupBy: keys, and rows of each group."""
+
+    def __init__(self, grouped):
+        ids, _, nb_groups = grouped.grouper.group_info
+
+        self.obj = grouped.obj
+        self.axis = grouped.axis
+        # Keys of groups, in group id order (tuples if there are several keys)
+        self.keys = list(grouped.grouper.result_index)
+
+        # Rows sorted by group (stable sort, so rows of a group keep their order).
+        # Rows without group (NA keys) are sorted first, and dropped.
+        self.sorter = np.argsort(ids, kind="mergesort")[np.count_nonzero(ids == -1) :]
+
+        self.lengths = np.bincount(ids[ids != -1], minlength=nb_groups)
+        self.offsets = np.concatenate(([0], np.cumsum(self.lengths)))
+
+    def __len__(self):
+        return len(self.lengths)
+
+    def get_chunk(self, positions):
+        """Return the GroupsChunk of groups at `positions` (in this order)."""
+        positions = list(positions)
+
+        first, last = positions[0], positions[-1]
+
+        if positions == list(range(first, last + 1)):
+            # Contiguous groups: a single slice of rows
+            rows = self.sorter[self.offsets[first] : self.offsets[last + 1]]
+        else:
+            rows = np.concatenate(
+                [
+                    self.sorter[self.offsets[position] : self.offsets[position + 1]]
+                    for position in positions
+                ]
+            )
+
+        return GroupsChunk(
+            self.obj.take(rows, axis=self.axis),
+            self.axis,
+            [self.keys[position] for position in positions],
+            self.lengths[positions],
+            positions,
+        )
+
+
+class GroupsChunk:
+    """Picklable chunk of groups.
+
+    Iterating over it yields (key, group), as iterating over a GroupBy does. Groups are
+    views over `data`.
+    """
+
+    def __init__(self, data, axis, keys, lengths, positions):
+        self.data = data
+        self.axis = axis
+        self.keys = keys
+        self.lengths = lengths
+        self.positions = positions
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __iter__(self):
+        start = 0
+
+        for key, length in zip(self.keys, self.lengths):
+            stop = start + length
+
+            if self.axis == 0:
+                yield key, self.data.iloc[start:stop]
+            else:
+                yield key, self.data.iloc[:, start:stop]
+
+            start = stop
@@ -0,0 +1,105 @@
+"""Latency histogram of calls of the function to apply (one call per row or per group,
+depending on the method).
+
+Each WORKER records, for each chunk, the duration of each call into a histogram with
+fixed log-scale buckets preallocated at the creation of the histogram: a call lasting
+`d` nanoseconds is counted in the bucket `d.bit_length()`, which holds durations in
+[2 ** (bucket - 1), 2 ** bucket[ nanoseconds. The MASTER sums histograms of all chunks.
+
+Calls are timed by hooks inlined at the beginning and before each return of the
+function (see `pandarallel.utils.inliner`), or by a thin wrapper around the function
+if bytecode inlining is not supported.
+"""
+
+from time import perf_counter
+
+from pandarallel.utils.inliner import IS_INLINING_SUPPORTED, inline
+
+try:
+    from time import perf_counter_ns
+except ImportError:  # Python < 3.7
+
+    def perf_counter_ns():
+        return int(perf_counter() * 1e9)
+
+
+# Durations up to 2 ** (NB_BUCKETS - 1) nanoseconds (about 292 years)
+NB_BUCKETS = 64
+
+
+def latency_pre_func(latency, clock):
+    latency.start = clock()
+
+
+def latency_post_func(latency, clock):
+    latency.counts[(clock() - latency.start).bit_length()] += 1
+
+
+class LatencyHistogram:
+    """Histogram of call durations.
+
+    - `counts`: Number of calls by bucket (see module docstring)
+    """
+
+    def __init__(self, counts=None):
+        self.counts = [0] * NB_BUCKETS if counts is None else list(counts)
+        self.start = 0
+
+    def wrap(self, func):
+        """Return the function to call instead of `func`, so calls of `func` are
+        recorded into this histogram."""
+        if IS_INLINING_SUPPORTED:
+            arguments = dict(latency=self, clock=perf_counter_ns)
+
+            return inline(
+                latency_pre_func, func, arguments, latency_post_func, arguments
+            )
+
+        counts = self.counts
+
+        def timed_func(*args, **kwargs):
+            start = perf_counter_ns()
+            result = func(*args, **kwargs)
+            counts[(perf_counter_ns() - start).bit_length()] += 1
+            return result
+
+        return timed_func
+
+    def add(self, counts):
+        """Add `counts` (the `counts` of another histogram) to this histogram."""
+        self.counts = [count + other for count, other in zip(self.counts, counts)]
+
+    @property
+    def nb_calls(self):
+        return sum(self.counts)
+
+    def percentile(self, q):
+        """Return the upper bound (in seconds) of the bucket holding the `q`-th
+        percentile (`q` in [0, 100]) of call durations, or None without any call."""
+        nb_calls = self.nb_calls
+
+        if nb_calls == 0:
+            return None
+
+        rank = q / 100 * nb_calls
+        cumulated = 0
+
+        for bucket, count in enumerate(self.counts):
+            cumulated += count
+
+            if count and cumulated >= rank:
+                return 2 ** bucket / 1e9
+
+        return None
+
+    def to_dict(self):
+        """Return non-empty buckets, by upper bound (in nanoseconds)."""
+        return {2 ** bucket: count for bucket, count in enumerate(self.counts) if count}
+
+    def __repr__(self):
+        if self.nb_calls == 0:
+            return "<LatencyHistogram: 0 calls>"
+
+        return "<LatencyHistogram: {} calls, p50 < {:.3g} s, p99 < {:.3g} s>".format(
+            self.nb_calls, self.percentile(50), self.percentile(99)
+        )
@@ -0,0 +1,114 @@
+"""Pickle files whose buffers (NumPy arrays, ...) are loaded without any copy.
+
+Objects are pickled with protocol 5 (Python >= 3.8), and buffers supporting it are
+written out-of-band, each one in its own page-aligned region of the file. Loading a
+file maps it in memory, and rebuilds objects over views of the mapping, so buffers are
+neither copied into the pickle stream when dumping, nor copied again when loading.
+
+The mapping is private (copy-on-write): loaded objects are writeable, but writing them
+does not modify the file. Files can also be loaded read-only: the mapping is then
+shared by all processes loading the file, and buffers are not writeable.
+
+File format (integers are unsigned 64 bits little endian):
+- length of the pickle stream, and number of out-of-band buffers
+- offset and size of each buffer
+- pickle stream
+- buffers
+
+With Python < 3.8, files are standard pickle files.
+"""
+
+import mmap
+import pickle
+import struct
+
+IS_PROTOCOL_5_AVAILABLE = pickle.HIGHEST_PROTOCOL >= 5
+
+# Offsets of buffers in files are multiples of PAGE_SIZE bytes
+PAGE_SIZE = mmap.ALLOCATIONGRANULARITY
+
+HEADER = struct.Struct("<QQ")
+ITEM = struct.Struct("<QQ")
+
+
+def align(offset):
+    return -(-offset // PAGE_SIZE) * PAGE_SIZE
+
+
+def open_for_dump(path, must_exist):
+    """Open the file at `path` for writing, emptied. If `must_exist` is set and the
+    file does not exist, a FileNotFoundError is raised instead of creating it."""
+    if not must_exist:
+        return open(path, "wb")
+
+    file = open(path, "r+b")
+    file.truncate()
+    return file
+
+
+def dump(obj, path, must_exist=False):
+    """Pickle `obj` into the file at `path`.
+
+    If `must_exist` is set, the file is not created (a FileNotFoundError is raised if
+    it does not exist).
+    """
+    if not IS_PROTOCOL_5_AVAILABLE:
+        with open_for_dump(path, must_exist) as file:
+            pickle.dump(obj, file)
+
+        return
+
+    buffers = []
+
+    def buffer_callback(buffer):
+        try:
+            buffers.append(buffer.raw())
+        except BufferError:
+            # Non contiguous buffer: Pickle it in-band
+            return True
+
+        return False
+
+    stream = pickle.dumps(obj, protocol=5, buffer_callback=buffer_callback)
+
+    offset = align(HEADER.size + ITEM.size * len(buffers) + len(stream))
+    items = []
+
+    for buffer in buffers:
+        items.append((offset, buffer.nbytes))
+        offset = align(offset + buffer.nbytes)
+
+    with open_for_dump(path, must_exist) as file:
+        file.write(HEADER.pack(len(stream), len(buffers)))
+
+        for item in items:
+            file.write(ITEM.pack(*item))
+
+        file.write(stream)
+
+        for (offset, _), buffer in zip(items, buffers):
+            file.seek(offset)
+            file.write(buffer)
+
+
+def load(path, read_only=False):
+    """Return the object pickled into the file at `path` by `dump`.
+
+    If `read_only` is set, buffers are mapped read-only (see module docstring).
+    """
+    with open(path, "rb") as file:
+        if not IS_PROTOCOL_5_AVAILABLE:
+            return pickle.load(file)
+
+        stream_length, nb_buffers = HEADER.unpack(file.read(HEADER.size))
+        items = [ITEM.unpack(file.read(ITEM.size)) for _ in range(nb_buffers)]
+        stream = file.read(stream_length)
+
+        if nb_buffers == 0:
+            return pickle.loads(stream)
+
+        access = mmap.ACCESS_READ if read_only else mmap.ACCESS_COPY
+        mapping = memoryview(mmap.mmap(file.fileno(), 0, access=access))
+
+    buffers = [mapping[offset : offset + size] for offset, size in items]
+    return pickle.loads(stream, buffers=buffers)
@@ -0,0 +1,126 @@
+"""Estimation of data sizes, and of the memory available to store them."""
+
+import os
+from tempfile import gettempdir
+
+import numpy as np
+import pandas as pd
+
+from pandarallel.utils.groups import GroupsChunk
+
+# Root of Memory File System
+MEMORY_FS_ROOT = "/dev/shm"
+
+# Data is dumped into Memory File System without measuring its deep size if the free
+# space is at least MEMORY_FS_MARGIN times its shallow size (see `dump_with_spill`)
+MEMORY_FS_MARGIN = 8
+
+# Files giving the memory limit and the memory usage of the cgroup of this process
+# (cgroup v2, then cgroup v1)
+CGROUP_FILES = (
+    ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory.current"),
+    (
+        "/sys/fs/cgroup/memory/memory.limit_in_bytes",
+        "/sys/fs/cgroup/memory/memory.usage_in_bytes",
+    ),
+)
+
+
+def get_size(data, deep=True):
+    """Return an estimation of the size (in bytes) of `data`.
+
+    Only DataFrames, Series, chunks of groups, NumPy arrays and bytes are measured. For
+    other objects, 0 is returned.
+
+    If `deep` is not set, Python objects (strings, ...) are not measured, only the
+    pointers to them: the size is a lower bound, computed in a constant time.
+    """
+    if isinstance(data, GroupsChunk):
+        data = data.data
+
+    if isinstance(data, pd.DataFrame):
+        return int(data.memory_usage(index=True, deep=deep).sum())
+
+    if isinstance(data, pd.Series):
+        return int(data.memory_usage(index=True, deep=deep))
+
+    if isinstance(data, np.ndarray):
+        return data.nbytes
+
+    if isinstance(data, bytes):
+        return len(data)
+
+    return 0
+
+
+def get_cgroup_headroom():
+    """Return the memory (in bytes) this process can still use before reaching the
+    memory limit of its cgroup, or None if there is no limit."""
+    for limit_path, usage_path in CGROUP_FILES:
+        try:
+            with open(limit_path) as file:
+                limit = file.read().strip()
+
+            with open(usage_path) as file:
+                usage = int(file.read())
+
+        except (OSError, ValueError):
+            continue
+
+        # Without limit, cgroup v2 gives "max", and cgroup v1 a huge number
+        if limit == "max" or int(limit) >= 2 ** 62:
+            return None
+
+        return max(int(limit) - usage, 0)
+
+    return None
+
+
+def get_memory_fs_free_space(path):
+    """Return the space (in bytes) available to write files into the directory at
+    `path`, in a memory file system.
+
+    Files of a memory file system are stored in memory, so the memory left by the
+    cgroup memory limit is also taken into account.
+    """
+    stat = os.statvfs(path)
+    free_space = stat.f_bavail * stat.f_frsize
+
+    headroom = get_cgroup_headroom()
+    return free_space if headroom is None else min(free_space, headroom)
+
+
+def dump_with_spill(data, dump, spill_dir, nb_copies=1):
+    """Dump `data` with `dump(directory)`, and return what it returns.
+
+    `dump` creates files in `directory` and dumps `data` into them. If it fails with an
+    OSError, it has to remove the files it created.
+
+    Files are created in Memory File System if it has enough free space for
+    `nb_copies` copies of `data`, else in `spill_dir` (or in the default temporary
+    directory if `spill_dir` is None). Files are also created in `spill_dir` if dumping
+    into Memory File System fails.
+
+    The deep size of `data` (measuring strings, ...) is slow to compute, so it is only
+    computed if the shallow size leaves less than MEMORY_FS_MARGIN times the needed
+    space free.
+    """
+    directories = [spill_dir or gettempdir()]
+
+    if os.path.isdir(MEMORY_FS_ROOT):
+        free_space = get_memory_fs_free_space(MEMORY_FS_ROOT)
+        needed_space = nb_copies * get_size(data, deep=False)
+
+        if MEMORY_FS_MARGIN * needed_space > free_space:
+            needed_space = nb_copies * get_size(data)
+
+        if needed_space <= free_space:
+            directories.insert(0, MEMORY_FS_ROOT)
+
+    for directory in directories:
+        try:
+            return dump(directory)
+
+        except OSError:
+            if directory == directories[-1]:
+                raise
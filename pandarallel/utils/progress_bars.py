@@ -1,8 +1,13 @@
 import shutil
 import sys
+from time import time
 
 MINIMUM_TERMINAL_WIDTH = 72
 
+# Bounds of the width of console bars, which shrink to fit the terminal
+MINIMUM_BAR_WIDTH = 10
+MAXIMUM_BAR_WIDTH = 40
+
 
 def is_notebook_lab():
     try:
@@ -21,6 +26,28 @@ def is_notebook_lab():
         return False
 
 
+def get_rate_and_eta(done, total, start):
+    """Return the throughput (in items per second) since `start`, and the estimated
+    time (in seconds) left to reach `total` items, or None if it cannot be estimated
+    yet."""
+    elapsed = time() - start
+    rate = done / elapsed if elapsed > 0 else 0
+
+    if done >= total:
+        return rate, 0
+
+    return rate, (total - done) / rate if rate > 0 else None
+
+
+def format_eta(eta):
+    if eta is None:
+        return "--:--:--"
+
+    minutes, seconds = divmod(int(eta), 60)
+    hours, minutes = divmod(minutes, 60)
+    return "{:d}:{:02d}:{:02d}".format(hours, minutes, seconds)
+
+
 def get_progress_bars(maxs):
     return (
         ProgressBarsNotebookLab(maxs)
@@ -33,6 +60,7 @@ class ProgressBarsConsole:
     def __init__(self, maxs):
         self.__bars = [[0, max] for max in maxs]
         self.__width = self.__get_width()
+        self.__start = time()
 
         self.__update_lines()
 
@@ -64,10 +92,21 @@ class ProgressBarsConsole:
 
     def __update_line(self, done, total):
         percent = done / total
-        bar = (":" * int(percent * 40)).ljust(40, " ")
+        rate, eta = get_rate_and_eta(done, total, self.__start)
+        format = (
+            " {percent:6.2f}% {bar:s} | {done:8d} / {total:8d} |"
+            " {rate:10.1f} it/s | ETA {eta:s} |"
+        )
+
+        # The bar shrinks so the line fits the terminal
+        kwargs = dict(done=done, total=total, rate=rate, eta=format_eta(eta))
+        other_width = len(format.format(percent=0, bar="", **kwargs))
+        bar_width = self.__width - other_width
+        bar_width = max(MINIMUM_BAR_WIDTH, min(MAXIMUM_BAR_WIDTH, bar_width))
+
+        bar = (":" * int(percent * bar_width)).ljust(bar_width, " ")
         percent = round(percent * 100, 2)
-        format = " {percent:6.2f}% {bar:s} | {done:8d} / {total:8d} |"
-        ret = format.format(percent=percent, bar=bar, done=done, total=total)
+        ret = format.format(percent=percent, bar=bar, **kwargs)
         return ret[: self.__width].ljust(self.__width, " ")
 
     def __update_lines(self):
@@ -97,6 +136,8 @@ class ProgressBarsNotebookLab:
         from IPython.display import display
         from ipywidgets import HBox, VBox, IntProgress, Label
 
+        self.__start = time()
+
         self.__bars = [
             HBox(
                 [
@@ -123,7 +164,10 @@ class ProgressBarsNotebookLab:
             if value >= bar.max:
                 bar.bar_style = "success"
 
-            label.value = "{} / {}".format(value, bar.max)
+            rate, eta = get_rate_and_eta(value, bar.max, self.__start)
+            label.value = "{} / {} | {:.1f} it/s | ETA {}".format(
+                value, bar.max, rate, format_eta(eta)
+            )
 
     def set_error(self, index):
         """Set a bar on error"""
@@ -0,0 +1,134 @@
+"""Progress of the function to apply, sampled by a background thread of the worker.
+
+This is the alternative to the bytecode inlining of `pandarallel.utils.inliner`, which
+only supports Python 3.5 to 3.8. Each call of the function only advances a counter, and
+a background thread copies the counter into the progression slot of the worker (read
+by the MASTER) every SAMPLING_PERIOD seconds.
+
+Calls are counted:
+- with `sys.monitoring` (Python >= 3.12), which calls back at each start and each end
+  of the code of the function, so the function itself is left untouched. Only starts
+  which are not nested into another call of the function (recursion) are counted,
+- else, by a thin wrapper around the function.
+"""
+
+import sys
+import threading
+
+IS_MONITORING_AVAILABLE = hasattr(sys, "monitoring")
+
+# `sys.monitoring` tool ids not reserved by Python (0, 1, 2 and 5 are reserved for
+# debuggers, coverage tools, profilers and optimizers)
+MONITORING_TOOL_IDS = (3, 4)
+MONITORING_TOOL_NAME = "pandarallel"
+
+# Period (in seconds) between two copies of the counter into the progression slot
+SAMPLING_PERIOD = 0.05
+
+
+def acquire_monitoring_tool_id():
+    """Return a free `sys.monitoring` tool id, now used by pandarallel, or None if
+    there is none."""
+    for tool_id in MONITORING_TOOL_IDS:
+        if sys.monitoring.get_tool(tool_id) is None:
+            sys.monitoring.use_tool_id(tool_id, MONITORING_TOOL_NAME)
+            return tool_id
+
+    return None
+
+
+class SampledProgress:
+    """Count calls of a function while a chunk is processed, and publish the count
+    into `progression` from a background thread.
+
+    Sampling runs inside a `with` block, which returns the SampledProgress. The
+    function to call instead of the function to apply is returned by `wrap`.
+    """
+
+    def __init__(self, progression, use_monitoring=IS_MONITORING_AVAILABLE):
+        self.progression = progression
+        self.use_monitoring = use_monitoring
+
+        # Number of calls, in a one-element list so calls update it in place
+        self.nb_calls = [0]
+
+        # Number of calls of the function running at once (with `sys.monitoring`)
+        self.depth = [0]
+
+        self.__tool_id = None
+        self.__monitored_code = None
+        self.__stopped = threading.Event()
+        self.__thread = threading.Thread(target=self.__sample, daemon=True)
+
+    def wrap(self, func):
+        """Return the function to call, so calls of `func` are counted."""
+        nb_calls, depth = self.nb_calls, self.depth
+
+        if self.use_monitoring and self.__tool_id is None:
+            self.__tool_id = acquire_monitoring_tool_id()
+
+        if self.__tool_id is not None:
+            events = sys.monitoring.events
+            code = func.__code__
+
+            def on_start(_code, _instruction_offset):
+                if depth[0] == 0:
+                    nb_calls[0] += 1
+
+                depth[0] += 1
+
+            def on_return(_code, _instruction_offset, _value):
+                depth[0] -= 1
+
+            # Unwinds are not local events, so they are received for all codes
+            def on_unwind(unwound_code, _instruction_offset, _exception):
+                if unwound_code is code:
+                    depth[0] -= 1
+
+            register_callback = sys.monitoring.register_callback
+            register_callback(self.__tool_id, events.PY_START, on_start)
+            register_callback(self.__tool_id, events.PY_RETURN, on_return)
+            register_callback(self.__tool_id, events.PY_UNWIND, on_unwind)
+
+            sys.monitoring.set_local_events(
+                self.__tool_id, code, events.PY_START | events.PY_RETURN
+            )
+            sys.monitoring.set_events(self.__tool_id, events.PY_UNWIND)
+
+            self.__monitored_code = code
+            return func
+
+        def counted_func(*args, **kwargs):
+            nb_calls[0] += 1
+            return func(*args, **kwargs)
+
+        return counted_func
+
+    def __sample(self):
+        while not self.__stopped.wait(SAMPLING_PERIOD):
+            self.progression.update(self.nb_calls[0])
+
+    def __enter__(self):
+        self.__thread.start()
+        return self
+
+    def __exit__(self, *_):
+        self.__stopped.set()
+        self.__thread.join()
+        self.progression.update(self.nb_calls[0])
+
+        if self.__tool_id is not None:
+            if self.__monitored_code is not None:
+                sys.monitoring.set_local_events(
+                    self.__tool_id, self.__monitored_code, 0
+                )
+
+            sys.monitoring.set_events(self.__tool_id, 0)
+
+            events = sys.monitoring.events
+
+            for event in (events.PY_START, events.PY_RETURN, events.PY_UNWIND):
+                sys.monitoring.register_callback(self.__tool_id, event, None)
+
+            sys.monitoring.free_tool_id(self.__tool_id)
+            self.__tool_id = None
@@ -0,0 +1,217 @@
+"""Transfer of DataFrame & Series chunks through shared memory.
+
+The MASTER copies numeric values of a chunk into a shared memory segment, and sends to
+a worker only a SharedChunk, which describes how to rebuild the chunk (index, columns,
+dtypes and non numeric values). The worker rebuilds the chunk as views over the
+segment, so numeric values are neither pickled nor unpickled.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from pandas.core.internals import BlockManager, make_block
+
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:
+    # Python < 3.8
+    resource_tracker, shared_memory = None, None
+
+# Offsets of values in segments are multiples of ALIGNMENT bytes
+ALIGNMENT = 64
+
+# Segments attached by this worker. A segment can only be closed once every object
+# built on it is released, so segments are closed lazily (see `close_released_segments`)
+attached_segments = []
+
+
+def is_shared_memory_available():
+    """Check if shared memory is available (Python >= 3.8)"""
+    return shared_memory is not None
+
+
+def start_resource_tracker():
+    """Start the resource tracker of the MASTER.
+
+    Workers created afterwards (by fork) share it. Else, each worker attaching a
+    segment would start its own resource tracker, which would destroy the segment (and
+    display warnings) when the worker exits.
+    """
+    resource_tracker.ensure_running()
+
+
+def is_shareable(dtype):
+    """Return True if values of type `dtype` can be put in shared memory."""
+    return isinstance(dtype, np.dtype) and dtype.kind in "biufcmM"
+
+
+def align(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+class Segment:
+    """Shared memory segment created by the MASTER.
+
+    Closing it also destroys it. Workers which already attached it can still use it.
+    """
+
+    def __init__(self, size):
+        self.shared_memory = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        self.name = self.shared_memory.name
+        self.is_closed = False
+
+    def close(self):
+        if self.is_closed:
+            return
+
+        self.is_closed = True
+        self.shared_memory.close()
+        self.shared_memory.unlink()
+
+
+class SharedChunk:
+    """Picklable description of a DataFrame or a Series whose numeric values are in the
+    shared memory segment named `name`.
+
+    `blocks` is a list of (dtype, positions, offset, values). Values of columns at
+    `positions` are either in the segment at `offset` (and `values` is None), or in
+    `values` (and `offset` is None).
+
+    `columns` is None for a Series.
+    """
+
+    def __init__(self, name, index, columns, series_name, blocks):
+        self.name = name
+        self.index = index
+        self.columns = columns
+        self.series_name = series_name
+        self.blocks = blocks
+
+    def attach(self):
+        """Rebuild the chunk as views over the segment. Runs on WORKERS."""
+        close_released_segments()
+
+        segment = shared_memory.SharedMemory(name=self.name)
+        attached_segments.append(segment)
+
+        nb_rows = len(self.index)
+
+        def get_values(dtype, positions, offset, values):
+            if offset is None:
+                return values
+
+            shape = (nb_rows,) if positions is None else (len(positions), nb_rows)
+            return np.ndarray(shape, dtype=dtype, buffer=segment.buf, offset=offset)
+
+        if self.columns is None:
+            (block,) = self.blocks
+            values = get_values(*block)
+            return pd.Series(
+                values, index=self.index, name=self.series_name, copy=False
+            )
+
+        blocks = [
+            make_block(get_values(*block), placement=block[1]) for block in self.blocks
+        ]
+
+        return pd.DataFrame(BlockManager(blocks, [self.columns, self.index]))
+
+
+def close_released_segments():
+    """Close segments attached by this worker and not used anymore. Runs on WORKERS."""
+    still_used = []
+
+    for segment in attached_segments:
+        try:
+            segment.close()
+        except BufferError:
+            # An object built on this segment still exists
+            still_used.append(segment)
+
+    attached_segments[:] = still_used
+
+
+def share(chunk):
+    """Copy numeric values of `chunk` into a new shared memory segment.
+
+    Return (shared_chunk, segment). If `chunk` is neither a DataFrame nor a Series, or
+    if it contains values which cannot be described by a NumPy dtype (categorical,
+    timezone aware datetimes, ...), `chunk` is returned unchanged (it will be pickled)
+    and `segment` is None.
+    """
+    if isinstance(chunk, pd.Series):
+        if not is_shareable(chunk.dtype):
+            return chunk, None
+
+        segment = Segment(chunk.values.nbytes)
+
+        try:
+            view = np.ndarray(
+                chunk.shape, dtype=chunk.dtype, buffer=segment.shared_memory.buf
+            )
+            view[:] = chunk.values
+            del view
+
+        except BaseException:
+            segment.close()
+            raise
+
+        block = (chunk.dtype, None, 0, None)
+        shared = SharedChunk(segment.name, chunk.index, None, chunk.name, [block])
+        return shared, segment
+
+    if not isinstance(chunk, pd.DataFrame):
+        return chunk, None
+
+    if not all(isinstance(dtype, np.dtype) for dtype in chunk.dtypes):
+        return chunk, None
+
+    dtype2positions = OrderedDict()
+    for position, dtype in enumerate(chunk.dtypes):
+        dtype2positions.setdefault(dtype, []).append(position)
+
+    nb_rows = len(chunk)
+    blocks, size = [], 0
+
+    for dtype, positions in dtype2positions.items():
+        if is_shareable(dtype):
+            blocks.append((dtype, positions, size, None))
+            size = align(size + len(positions) * nb_rows * dtype.itemsize)
+        else:
+            values = np.empty((len(positions), nb_rows), dtype=dtype)
+
+            for row, position in enumerate(positions):
+                values[row] = chunk.iloc[:, position].values
+
+            blocks.append((dtype, positions, None, values))
+
+    if all(offset is None for _, _, offset, _ in blocks):
+        # Nothing to share
+        return chunk, None
+
+    segment = Segment(size)
+
+    try:
+        for dtype, positions, offset, _ in blocks:
+            if offset is None:
+                continue
+
+            view = np.ndarray(
+                (len(positions), nb_rows),
+                dtype=dtype,
+                buffer=segment.shared_memory.buf,
+                offset=offset,
+            )
+
+            for row, position in enumerate(positions):
+                view[row] = chunk.iloc[:, position].values
+
+            del view
+
+    except BaseException:
+        segment.close()
+        raise
+
+    shared = SharedChunk(segment.name, chunk.index, chunk.columns, None, blocks)
+    return shared, segment
@@ -0,0 +1,159 @@
+"""Timing breakdown of parallel calls."""
+
+import json
+import pstats
+from contextlib import contextmanager
+from time import time
+
+from pandarallel.utils.latency import LatencyHistogram
+
+# Phases of a call run on the MASTER:
+# - sampling: Timing of the function on a sample (with `adaptive`)
+# - serial: Serial execution in the MASTER (with `adaptive`)
+# - chunking: Splitting of the data into chunks (`get_chunks`)
+# - serialization: Serialization of the function and its arguments (with the
+#   persistent pool only, else workers inherit them)
+# - pool_startup: Creation of workers (without the persistent pool)
+# - input_dump: Transfer of chunks into Memory File System or shared memory (chunks
+#   sent through pipes are pickled in a background thread, not measured)
+# - waiting: Waiting for workers, not counting `result_load`
+# - result_load: Loading of results from Memory File System
+# - reduce: Combination of results
+PHASES = (
+    "sampling",
+    "serial",
+    "chunking",
+    "serialization",
+    "pool_startup",
+    "input_dump",
+    "waiting",
+    "result_load",
+    "reduce",
+)
+
+# Phases of a chunk run on WORKERS:
+# - load: Loading of the chunk (from Memory File System or shared memory), and of the
+#   function to apply
+# - compute: Application of the function to the chunk
+# - dump: Dump of the result into Memory File System
+CHUNK_PHASES = ("load", "compute", "dump")
+
+
+class Stats:
+    """Timings (in seconds) of a parallel call.
+
+    - `phases`: Time spent in each phase run on the MASTER (see `PHASES`)
+    - `chunks`: For each processed chunk, a dict with its `index` (in the whole call,
+      across waves), the `pid` of the worker which processed it, and the time spent in
+      each phase run on the worker (see `CHUNK_PHASES`)
+    - `total`: Wall time of the whole call
+    - `profile`: Profiles of all chunks merged into a `pstats.Stats` object, if workers
+      profiled them (else None)
+    - `latency`: Latency histograms of all chunks merged into a LatencyHistogram, if
+      workers recorded them (else None)
+    """
+
+    def __init__(self):
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self.chunks = []
+        self.total = 0.0
+        self.profile = None
+        self.latency = None
+
+    @contextmanager
+    def measure(self, phase):
+        """Add the time spent in the `with` block to `phase`."""
+        start = time()
+
+        try:
+            yield
+        finally:
+            self.phases[phase] += time() - start
+
+    def timed(self, iterable, phase):
+        """Yield items of `iterable`, adding the time spent to get each of them to
+        `phase`."""
+        iterator = iter(iterable)
+
+        while True:
+            with self.measure(phase):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+
+            yield item
+
+    def add_chunk(self, index, timings, profile_stats=None, latency_counts=None):
+        """Record `timings` (and the profile, as built by
+        `cProfile.Profile.create_stats`, and the counts of the latency histogram) sent
+        by the worker which processed the chunk `index`."""
+        self.chunks.append(dict(index=index, **timings))
+
+        if latency_counts is not None:
+            if self.latency is None:
+                self.latency = LatencyHistogram(latency_counts)
+            else:
+                self.latency.add(latency_counts)
+
+        if profile_stats is None:
+            return
+
+        if self.profile is None:
+            self.profile = pstats.Stats(RawProfile(profile_stats))
+        else:
+            self.profile.add(RawProfile(profile_stats))
+
+    @property
+    def workers(self):
+        """Time spent in each phase run on workers, summed over chunks, by worker
+        pid."""
+        workers = dict()
+
+        for chunk in self.chunks:
+            worker = workers.setdefault(chunk["pid"], dict.fromkeys(CHUNK_PHASES, 0.0))
+
+            for phase in CHUNK_PHASES:
+                worker[phase] += chunk[phase]
+
+        return workers
+
+    def to_dict(self):
+        stats = dict(total=self.total, phases=self.phases, chunks=self.chunks)
+
+        if self.latency is not None:
+            stats["latency"] = self.latency.to_dict()
+
+        return stats
+
+    def __repr__(self):
+        phases = ", ".join(
+            "{}={:.3f}".format(phase, duration)
+            for phase, duration in self.phases.items()
+            if duration
+        )
+
+        return "<Stats: total={:.3f} s ({}), {} chunks>".format(
+            self.total, phases, len(self.chunks)
+        )
+
+
+class RawProfile:
+    """Profile sent by a worker, in a form `pstats.Stats` can load."""
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    def create_stats(self):
+        pass
+
+
+def emit(stats, callback, log_path):
+    """Call `callback` with `stats`, and append `stats` as a JSON line to the file at
+    `log_path`, if they are set."""
+    if callback is not None:
+        callback(stats)
+
+    if log_path is not None:
+        with open(log_path, "a") as file:
+            file.write(json.dumps(stats.to_dict()) + "\n")
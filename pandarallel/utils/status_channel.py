@@ -0,0 +1,132 @@
+from collections import deque
+from time import time
+
+# Number of last cancelled generations workers know about (see `cancel`)
+NB_CANCELLED_GENERATIONS = 16
+
+
+class StatusChannel:
+    """Channel used by WORKERS to inform the MASTER of their status.
+
+    - Status messages (INPUT_FILE_READ, VALUE & ERROR) are sent through a pipe.
+    - Progressions are written in shared memory, and are read by the MASTER whenever it
+      wants to, so a progression update does not involve any inter-process
+      communication.
+
+    Each worker process owns a progression slot (see `acquire_slot`). A slot contains
+    the index of the chunk currently processed by the worker, and the number of items
+    of this chunk already processed.
+
+    A StatusChannel has to be created before the workers, and is transmitted to them
+    by inheritance (fork).
+
+    Messages are tagged with the generation of their call. Several calls may use the
+    channel at once (e.g. a `parallel_*` call inside a `pandarallel.imap` loop), so the
+    MASTER keeps messages of each open generation (see `open`) until the call reads
+    them. Messages of other generations (calls already done) are dropped.
+    """
+
+    def __init__(self, context, nb_slots):
+        self.nb_slots = nb_slots
+        self.progresses = context.RawArray("l", 2 * nb_slots)
+
+        self.__reader, self.__writer = context.Pipe(duplex=False)
+        self.__lock = context.Lock()
+        self.__next_slot = context.Value("i", 0)
+
+        # Generation -> messages received but not read yet, for open generations
+        self.__pending = dict()
+
+        # Last cancelled generations, as a ring buffer
+        self.__cancelled = context.RawArray("l", [-1] * NB_CANCELLED_GENERATIONS)
+        self.__nb_cancelled = 0
+
+        self.reset_progresses()
+
+    def acquire_slot(self):
+        """Return the progression slot of the calling worker. Runs on WORKERS."""
+        with self.__next_slot.get_lock():
+            slot = self.__next_slot.value
+            self.__next_slot.value += 1
+
+        return slot % self.nb_slots
+
+    def put(self, message):
+        """Send `message` to the MASTER. Runs on WORKERS."""
+        with self.__lock:
+            self.__writer.send(message)
+
+    def open(self, generation):
+        """Start keeping messages of the call `generation`. Runs on the MASTER."""
+        self.__pending[generation] = deque()
+
+    def close(self, generation):
+        """Stop keeping messages of the call `generation`, and drop the ones not read
+        yet. Runs on the MASTER."""
+        self.__pending.pop(generation, None)
+
+    def cancel(self, generation):
+        """Cancel the call `generation`: workers skip its chunks not processed yet, and
+        do not dump results of chunks being processed. Runs on the MASTER."""
+        self.__cancelled[self.__nb_cancelled % NB_CANCELLED_GENERATIONS] = generation
+        self.__nb_cancelled += 1
+
+    def is_cancelled(self, generation):
+        """Return True if the call `generation` has been cancelled. Runs on WORKERS."""
+        return generation in self.__cancelled[:]
+
+    def get(self, generation, timeout=None):
+        """Return the next message sent by a worker about the (open) call `generation`,
+        as a (message type, payload) tuple.
+
+        Messages about other open calls received meanwhile are kept for them. If no
+        message about `generation` is received within `timeout` seconds, return None.
+        """
+        pending = self.__pending[generation]
+        deadline = None if timeout is None else time() + timeout
+
+        while not pending:
+            remaining = None if deadline is None else max(deadline - time(), 0)
+
+            if not self.__reader.poll(remaining):
+                return None
+
+            message_generation, message_type, payload = self.__reader.recv()
+
+            if message_generation in self.__pending:
+                self.__pending[message_generation].append((message_type, payload))
+
+        return pending.popleft()
+
+    def reset_progresses(self):
+        """Mark all slots as not processing any chunk."""
+        for slot in range(self.nb_slots):
+            self.progresses[2 * slot] = -1
+            self.progresses[2 * slot + 1] = 0
+
+    def get_progresses(self):
+        """Return a list of (chunk index, progression) of all slots processing a
+        chunk."""
+        progresses = self.progresses[:]
+
+        return [
+            (index, progression)
+            for index, progression in zip(progresses[::2], progresses[1::2])
+            if index >= 0
+        ]
+
+
+class Progression:
+    """Progression of the chunk processed by a worker."""
+
+    def __init__(self, channel, slot, index):
+        self.progresses = channel.progresses
+        self.offset = 2 * slot + 1
+
+        # Progression is reset before the chunk index is set, so the MASTER never sees
+        # the progression of a previous chunk associated to this chunk.
+        self.progresses[self.offset] = 0
+        self.progresses[self.offset - 1] = index
+
+    def update(self, iteration):
+        self.progresses[self.offset] = iteration
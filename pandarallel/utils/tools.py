@@ -1,6 +1,7 @@
+import heapq as _heapq
 import itertools as _itertools
 
-INPUT_FILE_READ, PROGRESSION, VALUE, ERROR = list(range(4))
+INPUT_FILE_READ, VALUE, ERROR = list(range(3))
 
 
 def chunk(nb_item, nb_chunks, start_offset=0):
@@ -52,3 +53,40 @@ def chunk(nb_item, nb_chunks, start_offset=0):
         slice(max(0, begin - start_offset), end)
         for begin, end in zip(shifted_accumulated, accumulated)
     ]
+
+
+def balance(costs, nb_chunks):
+    """
+    Split items into at most `nb_chunks` chunks of approximatively the same total cost.
+
+    Items are assigned by decreasing cost to the chunk with the lowest total cost so
+    far (Longest Processing Time first scheduling).
+
+    Parameters
+    ----------
+    costs : list of float
+        Cost of each item
+
+    nb_chunks : int
+        Number of chunks to return
+
+    Returns
+    -------
+    A list of lists of item positions. Positions are sorted in each list, and empty
+    chunks are not returned.
+
+
+    Examples
+    --------
+    >>> balance([1, 5, 2, 2, 1, 1], 2)
+    [[1, 4], [0, 2, 3, 5]]
+    """
+    chunks = [[] for _ in range(min(nb_chunks, len(costs)))]
+    heap = [(0, index) for index in range(len(chunks))]
+
+    for position in sorted(range(len(costs)), key=lambda item: -costs[item]):
+        total_cost, index = _heapq.heappop(heap)
+        chunks[index].append(position)
+        _heapq.heappush(heap, (total_cost + costs[position], index))
+
+    return [sorted(chunk) for chunk in chunks]
@@ -1,5 +1,7 @@
+import gc
 import math
 import sys
+import weakref
 
 import pytest
 
@@ -484,3 +486,127 @@ def test_inline():
     inlined_func = inliner.inline(pre_func, func, dict(b="pretty", c="world!"))
 
     assert inliner.are_functions_equivalent(inlined_func, target_inlined_func)
+
+
+def test_inline_post_func():
+    python_version = sys.version_info
+
+    if not (python_version.major == 3 and python_version.minor in (6, 7, 8)):
+        return
+
+    class Calls:
+        names = []
+
+    def pre_func(calls):
+        calls.names.append("pre")
+
+    def post_func(calls):
+        calls.names.append("post")
+
+    def func(x):
+        try:
+            for i in range(3):
+                if i == x:
+                    return i
+            return -1
+        finally:
+            Calls.names.append("finally")
+
+    inlined_func = inliner.inline(
+        pre_func, func, dict(calls=Calls), post_func, dict(calls=Calls)
+    )
+
+    assert inlined_func(1) == 1
+    assert inlined_func(5) == -1
+
+    # With Python < 3.8, a return runs the `finally` clause after `post_func`
+    assert sorted(Calls.names) == sorted(["pre", "finally", "post"] * 2)
+    assert Calls.names[0] == "pre"
+
+
+def test_inline_cache(monkeypatch):
+    python_version = sys.version_info
+
+    if not (python_version.major == 3 and python_version.minor in (5, 6, 7, 8)):
+        return
+
+    class Log:
+        pass
+
+    def pre_func(log, value):
+        log.value = value
+
+    def func(x):
+        return x + 1
+
+    inliner.inline_cache.clear()
+
+    log = Log()
+    inlined_func = inliner.inline(pre_func, func, dict(log=log, value=True))
+    assert inlined_func(1) == 2
+    assert log.value is True
+
+    def build_inlined_function(*_):
+        raise AssertionError("The inlined code should be cached")
+
+    monkeypatch.setattr(inliner, "build_inlined_function", build_inlined_function)
+
+    # Arguments equal to constants of `func` are not merged with them
+    other_log = Log()
+    inlined_func = inliner.inline(pre_func, func, dict(log=other_log, value=1.0))
+    assert inlined_func(1) == 2
+    assert type(other_log.value) is float
+    assert log.value is True
+    assert len(inliner.inline_cache) == 1
+
+
+def test_inline_cache_inlined_func(monkeypatch):
+    python_version = sys.version_info
+
+    if not (python_version.major == 3 and python_version.minor in (6, 7, 8)):
+        return
+
+    class Log:
+        def __init__(self):
+            self.names = []
+
+    def pre_func(log):
+        log.names.append("pre")
+
+    def post_func(log):
+        log.names.append("post")
+
+    def func(x):
+        return x + 1
+
+    inliner.inline_cache.clear()
+
+    def inline_twice(pre_log, post_log):
+        """Inline hooks into a function which is itself inlined (as progress bars,
+        then latency, inline their hooks into the function to apply)"""
+        inlined_func = inliner.inline(pre_func, func, dict(log=pre_log))
+        return inliner.inline(
+            pre_func, inlined_func, dict(log=post_log), post_func, dict(log=post_log)
+        )
+
+    inlined_func = inline_twice(Log(), Log())
+    assert inlined_func(1) == 2
+
+    def build_inlined_function(*_):
+        raise AssertionError("The inlined code should be cached")
+
+    monkeypatch.setattr(inliner, "build_inlined_function", build_inlined_function)
+
+    # New arguments (as for each chunk) do not change keys of the cache
+    pre_log, post_log = Log(), Log()
+    inlined_func = inline_twice(pre_log, post_log)
+    assert inlined_func(1) == 2
+    assert pre_log.names == ["pre"]
+    assert post_log.names == ["pre", "post"]
+    assert len(inliner.inline_cache) == 2
+
+    # The cache keeps no argument alive
+    pre_log_ref, post_log_ref = weakref.ref(pre_log), weakref.ref(post_log)
+    del inlined_func, pre_log, post_log
+    gc.collect()
+    assert pre_log_ref() is None and post_log_ref() is None
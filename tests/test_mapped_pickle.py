@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+
+from pandarallel.utils import mapped_pickle
+
+
+def test_dump_load(tmp_path):
+    path = str(tmp_path / "file.pickle")
+
+    df = pd.DataFrame(
+        dict(a=np.random.rand(1000), b=np.arange(1000), c=["x", "y"] * 500)
+    )
+
+    for obj in (df, df.iloc[10:20], df.a, df.b.values[::2], pd.Series([], dtype=float)):
+        mapped_pickle.dump(obj, path)
+        loaded = mapped_pickle.load(path)
+
+        if isinstance(obj, np.ndarray):
+            assert np.array_equal(loaded, obj)
+        else:
+            assert loaded.equals(obj)
+
+    mapped_pickle.dump(dict(key="value"), path)
+    assert mapped_pickle.load(path) == dict(key="value")
+
+
+def test_loaded_buffers_are_writeable(tmp_path):
+    path = str(tmp_path / "file.pickle")
+    array = np.arange(1000)
+
+    mapped_pickle.dump(array, path)
+    loaded = mapped_pickle.load(path)
+    loaded[:] = 0
+
+    # The file is not modified
+    assert np.array_equal(mapped_pickle.load(path), array)
+
+
+def test_load_read_only(tmp_path):
+    path = str(tmp_path / "file.pickle")
+    series = pd.Series(np.random.rand(1000))
+
+    mapped_pickle.dump(series, path)
+    loaded = mapped_pickle.load(path, read_only=True)
+
+    assert loaded.equals(series)
+
+    if mapped_pickle.IS_PROTOCOL_5_AVAILABLE:
+        assert not loaded.values.flags.writeable
@@ -1,4 +1,10 @@
+import importlib
+import json
 import math
+import os
+import pickle
+import sys
+import time
 from datetime import datetime
 
 import numpy as np
@@ -6,6 +12,7 @@ import pandas as pd
 import pytest
 
 from pandarallel import pandarallel
+from pandarallel.utils import mapped_pickle
 
 
 @pytest.fixture(params=(1000, 1))
@@ -300,4 +307,755 @@ def test_dataframe_groupby_expanding_apply(
         .b.expanding()
         .parallel_apply(func_dataframe_groupby_expanding_apply, raw=False)
     )
-    res.equals(res_parallel)
\ No newline at end of file
+    res.equals(res_parallel)
+
+
+def test_persistent_pool(use_memory_fs):
+    df = pd.DataFrame(dict(a=np.random.rand(1000) + 1))
+
+    with pandarallel.initialize(
+        use_memory_fs=use_memory_fs, nb_workers=2, persistent_pool=True
+    ) as pool:
+        for _ in range(3):
+            res = df.a.apply(math.sqrt)
+            res_parallel = df.a.parallel_apply(math.sqrt)
+            assert res.equals(res_parallel)
+
+    assert not pool.is_alive
+
+    # Once the persistent pool is shut down, each call creates its own workers
+    res_parallel = df.a.parallel_apply(math.sqrt)
+    assert res.equals(res_parallel)
+
+
+def test_persistent_pool_call_sent_once(monkeypatch, use_memory_fs):
+    big = np.ones(1000000)
+
+    def func(x, big):
+        return x * big[0]
+
+    series = pd.Series(np.random.rand(100))
+
+    with pandarallel.initialize(
+        use_memory_fs=use_memory_fs,
+        nb_workers=2,
+        nb_chunks_per_worker=4,
+        persistent_pool=True,
+    ) as pool:
+        task_sizes = []
+        apply_async = pool.pool.apply_async
+
+        def spy_apply_async(func, args):
+            task_sizes.append(len(pickle.dumps(args)))
+            return apply_async(func, args)
+
+        monkeypatch.setattr(pool.pool, "apply_async", spy_apply_async)
+
+        res_parallel = series.parallel_apply(func, args=(big,))
+        assert series.apply(func, args=(big,)).equals(res_parallel)
+
+    # The function and its arguments (8 MB) are not sent with each chunk
+    assert len(task_sizes) == 8
+    assert max(task_sizes) < 100000
+
+
+def test_persistent_pool_cancel(use_memory_fs):
+    def func(x):
+        if x < 0:
+            raise ValueError("Error")
+
+        time.sleep(0.05)
+        return x
+
+    # 20 chunks of 10 rows, the first one failing at once
+    series = pd.Series(np.arange(-1, 199))
+
+    def list_files():
+        if not os.path.exists("/dev/shm"):
+            return set()
+
+        return {name for name in os.listdir("/dev/shm") if name.startswith("pandarallel")}
+
+    files = list_files()
+
+    with pandarallel.initialize(
+        use_memory_fs=use_memory_fs,
+        nb_workers=2,
+        nb_chunks_per_worker=10,
+        persistent_pool=True,
+    ):
+        with pytest.raises(ValueError):
+            series.parallel_apply(func)
+
+        # Chunks of the failed call are skipped (processing them takes about 5 s)
+        start = time.time()
+        res_parallel = series.abs().parallel_apply(math.sqrt)
+        assert time.time() - start < 2
+
+        assert series.abs().apply(math.sqrt).equals(res_parallel)
+
+    # Workers of the failed call did not dump results into removed files
+    assert list_files() == files
+
+
+@pytest.mark.parametrize("nb_chunks_per_worker", (1, 4))
+def test_worker_error(use_memory_fs, nb_chunks_per_worker):
+    def func(x):
+        if x >= 100:
+            raise ValueError("Error")
+
+        return x
+
+    series = pd.Series(np.arange(1000))
+
+    pandarallel.initialize(
+        use_memory_fs=use_memory_fs,
+        nb_workers=2,
+        nb_chunks_per_worker=nb_chunks_per_worker,
+    )
+
+    # The error is raised while other workers fail (so send their result) too
+    for _ in range(20):
+        with pytest.raises(ValueError):
+            series.parallel_apply(func)
+
+    assert series.apply(math.sqrt).equals(series.parallel_apply(math.sqrt))
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="requires Python >= 3.8")
+def test_shared_memory(progress_bar):
+    pandarallel.initialize(
+        progress_bar=progress_bar, use_shared_memory=True, nb_workers=2
+    )
+
+    df = pd.DataFrame(
+        dict(
+            a=np.random.randint(1, 8, 1000),
+            b=np.random.rand(1000),
+            c=[str(item) for item in range(1000)],
+            d=np.random.rand(1000),
+            e=pd.date_range("2020-01-01", periods=1000),
+        )
+    )
+
+    def func(x):
+        return x.a * x.b + len(x.c) + x.d + x.e.day
+
+    res = df.apply(func, axis=1)
+    res_parallel = df.parallel_apply(func, axis=1)
+    assert res.equals(res_parallel)
+
+    res = df.b.map(lambda x: math.sqrt(x))
+    res_parallel = df.b.parallel_map(lambda x: math.sqrt(x))
+    assert res.equals(res_parallel)
+
+    # Chunks which are not DataFrames or Series are pickled
+    res = df.groupby("a").apply(lambda df: df.b.sum())
+    res_parallel = df.groupby("a").parallel_apply(lambda df: df.b.sum())
+    assert res.equals(res_parallel)
+
+
+def test_inherited_memory(progress_bar):
+    pandarallel.initialize(
+        progress_bar=progress_bar, use_inherited_memory=True, nb_workers=2
+    )
+
+    df = pd.DataFrame(dict(a=np.random.randint(1, 8, 1000), b=np.random.rand(1000)))
+    df.index = [item / 10 for item in df.index]
+
+    def func(x):
+        return x.a * x.b
+
+    res = df.apply(func, axis=1)
+    res_parallel = df.parallel_apply(func, axis=1)
+    assert res.equals(res_parallel)
+
+    res = df.groupby("a").apply(lambda df: df.b.sum())
+    res_parallel = df.groupby("a").parallel_apply(lambda df: df.b.sum())
+    assert res.equals(res_parallel)
+
+    with pytest.raises(ValueError):
+        pandarallel.initialize(use_inherited_memory=True, persistent_pool=True)
+
+
+def test_nb_chunks_per_worker(progress_bar, use_memory_fs):
+    pandarallel.initialize(
+        progress_bar=progress_bar,
+        use_memory_fs=use_memory_fs,
+        nb_workers=2,
+        nb_chunks_per_worker=5,
+    )
+
+    df = pd.DataFrame(dict(a=np.random.randint(1, 8, 1000), b=np.random.rand(1000)))
+
+    def func(x):
+        return x.a * x.b
+
+    res = df.apply(func, axis=1)
+    res_parallel = df.parallel_apply(func, axis=1)
+    assert res.equals(res_parallel)
+
+    res = df.a.map(lambda x: x ** 2)
+    res_parallel = df.a.parallel_map(lambda x: x ** 2)
+    assert res.equals(res_parallel)
+
+    res = df.groupby("a").apply(lambda df: df.b.sum())
+    res_parallel = df.groupby("a").parallel_apply(lambda df: df.b.sum())
+    assert res.equals(res_parallel)
+
+    with pytest.raises(ValueError):
+        pandarallel.initialize(nb_chunks_per_worker=0)
+
+
+@pytest.mark.parametrize("group_cost", (None, lambda nb_rows: nb_rows ** 2))
+def test_group_cost(progress_bar, group_cost):
+    pandarallel.initialize(progress_bar=progress_bar, group_cost=group_cost)
+
+    # Power-law distributed group sizes
+    keys = np.concatenate([np.full(2 ** size, size) for size in range(12)])
+    np.random.shuffle(keys)
+    df = pd.DataFrame(dict(a=keys, b=np.random.rand(len(keys))))
+
+    def func(df):
+        return df.b.cumsum()
+
+    res = df.groupby("a").apply(func)
+    res_parallel = df.groupby("a").parallel_apply(func)
+    assert res.equals(res_parallel)
+
+    res = df.groupby("a").apply(lambda df: df.b.mean())
+    res_parallel = df.groupby("a").parallel_apply(lambda df: df.b.mean())
+    assert res.equals(res_parallel)
+
+
+@pytest.mark.parametrize(
+    "groupby_kwargs", (dict(by="a"), dict(by=["a", "b"]), dict(by="b", sort=False))
+)
+def test_dataframe_groupby_keys(groupby_kwargs):
+    pandarallel.initialize(nb_workers=3, nb_chunks_per_worker=2)
+
+    df = pd.DataFrame(
+        dict(
+            a=np.random.choice([1.0, 2.0, np.nan, 5.0], 1000),
+            b=np.random.randint(0, 20, 1000),
+            c=np.random.rand(1000),
+        ),
+        index=np.random.permutation(1000),
+    )
+
+    def func(df):
+        return df.c.cumsum()
+
+    res = df.groupby(**groupby_kwargs).apply(func)
+    res_parallel = df.groupby(**groupby_kwargs).parallel_apply(func)
+    assert res.equals(res_parallel)
+
+
+def test_inherited_func(use_memory_fs):
+    pandarallel.initialize(use_memory_fs=use_memory_fs, nb_workers=2)
+
+    # Generators cannot be pickled (even with dill), so this function can be applied
+    # only if workers inherit it
+    generator = (item for item in range(10))
+
+    def func(x):
+        return x + (generator is not None)
+
+    df = pd.DataFrame(dict(a=np.random.rand(1000)))
+    assert df.a.apply(func).equals(df.a.parallel_apply(func))
+
+
+def test_broadcast(progress_bar):
+    series = pd.Series(np.random.randint(0, 100, 1000))
+    mapper = {key: key ** 2 for key in range(100)}
+    offset = pd.Series(range(100))
+
+    def func(x, offset):
+        return x + offset[x]
+
+    with pandarallel.initialize(
+        progress_bar=progress_bar, nb_workers=2, persistent_pool=True
+    ):
+        with pandarallel.broadcast(mapper) as broadcast_mapper:
+            for _ in range(2):
+                res_parallel = series.parallel_map(broadcast_mapper)
+                assert series.map(mapper).equals(res_parallel)
+
+        with pandarallel.broadcast(offset) as broadcast_offset:
+            res_parallel = series.parallel_apply(func, args=(broadcast_offset,))
+            assert series.apply(func, args=(offset,)).equals(res_parallel)
+
+            # Workers map values of the broadcasted Series read-only
+            res_parallel = series.parallel_apply(
+                lambda _, offset: offset.values.flags.writeable,
+                args=(broadcast_offset,),
+            )
+
+            is_mapped = mapped_pickle.IS_PROTOCOL_5_AVAILABLE
+            assert (~res_parallel).all() if is_mapped else res_parallel.all()
+
+        assert not os.path.exists(broadcast_offset.path)
+
+
+def test_spill_dir(monkeypatch, tmp_path):
+    # `pandarallel.pandarallel` is shadowed by the `pandarallel` class
+    module = importlib.import_module("pandarallel.pandarallel")
+    memory = importlib.import_module("pandarallel.utils.memory")
+
+    directories = []
+    create_temp_files = module.create_temp_files
+
+    def recording_create_temp_files(nb_files, directory=module.MEMORY_FS_ROOT):
+        directories.append(directory)
+        return create_temp_files(nb_files, directory)
+
+    # Memory file system is full
+    monkeypatch.setattr(memory, "get_memory_fs_free_space", lambda _: 0)
+    monkeypatch.setattr(module, "create_temp_files", recording_create_temp_files)
+
+    pandarallel.initialize(use_memory_fs=True, nb_workers=2, spill_dir=str(tmp_path))
+
+    df = pd.DataFrame(dict(a=np.random.rand(1000)))
+    assert df.a.apply(math.sqrt).equals(df.a.parallel_apply(math.sqrt))
+
+    assert directories == [str(tmp_path)] * 2
+    assert not os.listdir(str(tmp_path))
+
+    # Broadcasted objects are spilled too
+    with pandarallel.broadcast(np.random.rand(1000)) as broadcast_array:
+        assert os.path.dirname(broadcast_array.path) == str(tmp_path)
+
+    assert not os.listdir(str(tmp_path))
+
+
+@pytest.mark.skipif(not os.path.exists("/dev/shm"), reason="requires /dev/shm")
+def test_dump_chunk_deep_size(monkeypatch, tmp_path):
+    module = importlib.import_module("pandarallel.pandarallel")
+    memory = importlib.import_module("pandarallel.utils.memory")
+
+    deep_sizes = []
+    get_size = memory.get_size
+
+    def recording_get_size(data, deep=True):
+        deep_sizes.append(deep)
+        return get_size(data, deep)
+
+    monkeypatch.setattr(memory, "get_size", recording_get_size)
+
+    chunk = pd.Series([str(item) * 10 for item in range(1000)])
+    shallow_size = 2 * get_size(chunk, deep=False)
+
+    # Plenty of room: the deep size is not computed
+    monkeypatch.setattr(memory, "get_memory_fs_free_space", lambda _: 2 ** 40)
+
+    for file in module.dump_chunk(chunk, str(tmp_path)):
+        assert os.path.dirname(file.name) == module.MEMORY_FS_ROOT
+        file.close()
+
+    assert deep_sizes == [False]
+
+    # Little room: the deep size (bigger than the free space) is computed
+    deep_sizes.clear()
+    monkeypatch.setattr(memory, "get_memory_fs_free_space", lambda _: shallow_size)
+
+    for file in module.dump_chunk(chunk, str(tmp_path)):
+        assert os.path.dirname(file.name) == str(tmp_path)
+        file.close()
+
+    assert deep_sizes == [False, True]
+
+
+def test_max_memory(progress_bar, use_memory_fs):
+    df = pd.DataFrame(dict(a=np.random.randint(1, 8, 1000), b=np.random.rand(1000)))
+    data_size = df.memory_usage(index=True, deep=True).sum()
+
+    # 4 waves
+    pandarallel.initialize(
+        progress_bar=progress_bar,
+        use_memory_fs=use_memory_fs,
+        nb_workers=2,
+        max_memory=data_size // 2,
+    )
+
+    def func(x):
+        return x.a * x.b
+
+    res = df.apply(func, axis=1)
+    res_parallel = df.parallel_apply(func, axis=1)
+    assert res.equals(res_parallel)
+
+    # Chunks of all waves are told apart
+    chunks = pandarallel.last_stats().chunks
+    assert sorted(chunk["index"] for chunk in chunks) == list(range(8))
+
+    res = df.groupby("a").apply(lambda df: df.b.sum())
+    res_parallel = df.groupby("a").parallel_apply(lambda df: df.b.sum())
+    assert res.equals(res_parallel)
+
+
+class LoadCounter:
+    """Object appending a line to the file at `path` each time it is unpickled."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+        with open(self.path, "a") as file:
+            file.write("loaded\n")
+
+    def count(self):
+        with open(self.path) as file:
+            return len(file.readlines())
+
+
+def test_max_memory_persistent_pool(use_memory_fs, tmp_path):
+    series = pd.Series(np.random.rand(1000))
+    data_size = series.memory_usage(index=True, deep=True)
+    load_counter = LoadCounter(str(tmp_path / "loads"))
+
+    def func(x, load_counter):
+        return x * 2
+
+    # 4 waves
+    with pandarallel.initialize(
+        use_memory_fs=use_memory_fs,
+        nb_workers=2,
+        max_memory=data_size // 2,
+        persistent_pool=True,
+    ):
+        res_parallel = series.parallel_apply(func, args=(load_counter,))
+        assert series.apply(func, args=(load_counter,)).equals(res_parallel)
+
+    # The call is loaded once per worker, not once per wave
+    assert len(pandarallel.last_stats().chunks) == 8
+    assert load_counter.count() <= 2
+
+
+@pytest.mark.parametrize("persistent_pool", (False, True))
+@pytest.mark.parametrize("ordered", (True, False))
+def test_imap(use_memory_fs, persistent_pool, ordered):
+    def frames():
+        for index in range(10):
+            yield pd.DataFrame(dict(a=np.random.rand(100), b=index))
+
+    def func(df, power, bias=0):
+        return df.a.pow(power).sum() + bias, df.b.iloc[0]
+
+    pandarallel.initialize(
+        nb_workers=2, use_memory_fs=use_memory_fs, persistent_pool=persistent_pool
+    )
+
+    try:
+        results = list(pandarallel.imap(func, frames(), 2, ordered=ordered, bias=1))
+    finally:
+        pandarallel.shutdown()
+
+    assert len(results) == 10
+    assert all(result > 1 for result, _ in results)
+
+    indexes = [index for _, index in results]
+    assert indexes == list(range(10)) if ordered else sorted(indexes) == list(range(10))
+
+
+def test_imap_with_parallel_calls(progress_bar, use_memory_fs, tmp_path):
+    def frames():
+        for index in range(6):
+            yield pd.DataFrame(dict(a=np.random.rand(100), b=index))
+
+    def func(df, load_counter):
+        return df.b.iloc[0]
+
+    load_counter = LoadCounter(str(tmp_path / "loads"))
+
+    series = pd.Series(np.random.rand(1000))
+
+    pandarallel.initialize(
+        nb_workers=2,
+        progress_bar=progress_bar,
+        use_memory_fs=use_memory_fs,
+        persistent_pool=True,
+    )
+
+    try:
+        # Calls share the status channel of the persistent pool with the iteration
+        indexes = []
+
+        for index in pandarallel.imap(func, frames(), load_counter):
+            indexes.append(index)
+            assert series.apply(math.sin).equals(series.parallel_apply(math.sin))
+    finally:
+        pandarallel.shutdown()
+
+    assert indexes == list(range(6))
+
+    # The call of the iteration is loaded once per worker, despite the other calls
+    assert load_counter.count() <= 2
+
+
+def test_imap_error():
+    def func(df):
+        raise ValueError("Error")
+
+    pandarallel.initialize(nb_workers=2)
+
+    with pytest.raises(ValueError):
+        list(
+            pandarallel.imap(
+                func, (pd.DataFrame(dict(a=[index])) for index in range(5))
+            )
+        )
+
+
+def test_dataframe_map_partitions(progress_bar, use_memory_fs, df_size):
+    def func(df, power, bias=0):
+        return df.a.pow(power).add(df.b).to_frame("c") + bias
+
+    df = pd.DataFrame(
+        dict(a=np.random.randint(1, 8, df_size), b=np.random.rand(df_size))
+    )
+
+    pandarallel.initialize(progress_bar=progress_bar, use_memory_fs=use_memory_fs)
+    res = func(df, 2, bias=3)
+    res_parallel = df.parallel_map_partitions(func, 2, bias=3)
+    assert res.equals(res_parallel)
+
+
+def test_series_map_partitions(progress_bar, use_memory_fs, df_size):
+    series = pd.Series(np.random.rand(df_size))
+
+    pandarallel.initialize(progress_bar=progress_bar, use_memory_fs=use_memory_fs)
+    res = np.log1p(series)
+    res_parallel = series.parallel_map_partitions(np.log1p)
+    assert res.equals(res_parallel)
+
+
+def test_adaptive(use_memory_fs):
+    def fast_func(x):
+        return x + 1
+
+    def slow_func(x):
+        time.sleep(0.0005)
+        return x + 1
+
+    series = pd.Series(range(2000))
+
+    pandarallel.initialize(nb_workers=2, use_memory_fs=use_memory_fs, adaptive=True)
+
+    res_parallel = series.parallel_apply(fast_func)
+    assert series.apply(fast_func).equals(res_parallel)
+    assert pandarallel.last_decision().is_serial
+
+    res_parallel = series.parallel_apply(slow_func)
+    assert series.apply(fast_func).equals(res_parallel)
+    assert pandarallel.last_decision().nb_workers == 2
+
+    df = pd.DataFrame(dict(a=np.random.randint(1, 8, 100), b=np.random.rand(100)))
+    res = df.groupby("a").apply(lambda df: df.b.sum())
+    res_parallel = df.groupby("a").parallel_apply(lambda df: df.b.sum())
+    assert res.equals(res_parallel)
+    assert pandarallel.last_decision() is not None
+
+
+def test_stats(use_memory_fs, tmp_path):
+    emitted_stats = []
+    stats_log = tmp_path / "stats.jsonl"
+
+    pandarallel.initialize(
+        nb_workers=2,
+        use_memory_fs=use_memory_fs,
+        nb_chunks_per_worker=2,
+        stats_callback=emitted_stats.append,
+        stats_log=str(stats_log),
+    )
+
+    series = pd.Series(np.random.rand(1000))
+
+    for _ in range(2):
+        res_parallel = series.parallel_apply(math.sqrt)
+        assert series.apply(math.sqrt).equals(res_parallel)
+
+    stats = pandarallel.last_stats()
+    assert emitted_stats[-1] is stats
+    assert stats.total >= sum(stats.phases.values())
+    assert stats.phases["pool_startup"] > 0
+    assert sorted(chunk["index"] for chunk in stats.chunks) == list(range(4))
+    assert all(chunk["compute"] > 0 for chunk in stats.chunks)
+    assert len(stats.workers) <= 2
+
+    lines = stats_log.read_text().splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[-1]) == json.loads(json.dumps(stats.to_dict()))
+
+
+@pytest.mark.parametrize("persistent_pool", (False, True))
+def test_profile(use_memory_fs, persistent_pool):
+    def profiled_func(x):
+        return x ** 2
+
+    series = pd.Series(np.random.rand(1000))
+
+    pandarallel.initialize(
+        nb_workers=2,
+        use_memory_fs=use_memory_fs,
+        persistent_pool=persistent_pool,
+        profile=True,
+    )
+
+    try:
+        res_parallel = series.parallel_apply(profiled_func)
+    finally:
+        pandarallel.shutdown()
+
+    assert series.apply(profiled_func).equals(res_parallel)
+
+    profile = pandarallel.last_stats().profile
+    nb_calls = sum(
+        stat[1]
+        for (_, _, name), stat in profile.stats.items()
+        if name == "profiled_func"
+    )
+    assert nb_calls == 1000
+
+
+@pytest.mark.parametrize("persistent_pool", (False, True))
+def test_collect_latency(
+    progress_bar, use_memory_fs, persistent_pool, func_dataframe_groupby_apply
+):
+    def func(x):
+        return math.sin(x) ** 2
+
+    df = pd.DataFrame(dict(a=np.random.randint(1, 8, 1000), b=np.random.rand(1000)))
+
+    pandarallel.initialize(
+        nb_workers=2,
+        progress_bar=progress_bar,
+        use_memory_fs=use_memory_fs,
+        persistent_pool=persistent_pool,
+        collect_latency=True,
+    )
+
+    try:
+        res_parallel = df.b.parallel_apply(func)
+        latency = pandarallel.last_stats().latency
+
+        res_groupby = df.groupby("a").parallel_apply(func_dataframe_groupby_apply)
+        groupby_latency = pandarallel.last_stats().latency
+
+        # Only Python functions are timed
+        df.b.parallel_apply(math.sin)
+        assert pandarallel.last_stats().latency is None
+    finally:
+        pandarallel.shutdown()
+
+    assert df.b.apply(func).equals(res_parallel)
+    assert df.groupby("a").apply(func_dataframe_groupby_apply).equals(res_groupby)
+
+    assert latency.nb_calls == 1000
+    assert 0 < latency.percentile(50) <= latency.percentile(99) < 1
+
+    # Each group is processed by one call (pandas may call the function twice on the
+    # first group)
+    assert df.a.nunique() <= groupby_latency.nb_calls <= 2 * df.a.nunique()
+
+
+@pytest.mark.parametrize("progress_bar_per_worker", (False, True))
+def test_progress_bar_per_worker(capsys, progress_bar_per_worker):
+    series = pd.Series(np.random.rand(1000))
+
+    pandarallel.initialize(
+        nb_workers=2,
+        progress_bar=True,
+        verbose=0,
+        progress_bar_per_worker=progress_bar_per_worker,
+    )
+
+    res_parallel = series.parallel_apply(math.sqrt)
+    assert series.apply(math.sqrt).equals(res_parallel)
+
+    # Bars are rendered on as many lines as bars
+    out = capsys.readouterr().out
+    assert ("\n" in out) == progress_bar_per_worker
+    assert "it/s" in out and "ETA 0:00:00" in out
+
+
+def test_sampled_progress(monkeypatch, use_memory_fs, func_dataframe_apply_axis_1):
+    # `pandarallel.pandarallel` is shadowed by the `pandarallel` class
+    module = importlib.import_module("pandarallel.pandarallel")
+
+    # Workers are forked after this point, so they use sampled progress too
+    monkeypatch.setattr(module, "IS_INLINING_SUPPORTED", False)
+
+    df = pd.DataFrame(dict(a=np.random.randint(1, 8, 1000), b=np.random.rand(1000)))
+
+    pandarallel.initialize(progress_bar=True, use_memory_fs=use_memory_fs)
+    res = df.apply(func_dataframe_apply_axis_1, axis=1)
+    res_parallel = df.parallel_apply(func_dataframe_apply_axis_1, axis=1)
+    assert res.equals(res_parallel)
+
+
+def test_threads_backend(
+    progress_bar, func_dataframe_apply_axis_1, func_dataframe_groupby_apply
+):
+    df = pd.DataFrame(dict(a=np.random.randint(1, 8, 1000), b=np.random.rand(1000)))
+
+    pandarallel.initialize(nb_workers=2, progress_bar=progress_bar, backend="threads")
+
+    res = df.apply(func_dataframe_apply_axis_1, axis=1)
+    res_parallel = df.parallel_apply(func_dataframe_apply_axis_1, axis=1)
+    assert res.equals(res_parallel)
+
+    # Chunks are not transferred
+    assert pandarallel.last_stats().phases["input_dump"] == 0
+
+    res = df.groupby("a").apply(func_dataframe_groupby_apply)
+    res_parallel = df.groupby("a").parallel_apply(func_dataframe_groupby_apply)
+    assert res.equals(res_parallel)
+
+    # The backend can be overridden per call
+    res_parallel = df.b.parallel_apply(math.sin, backend="processes")
+    assert df.b.apply(math.sin).equals(res_parallel)
+
+    with pytest.raises(ZeroDivisionError):
+        df.b.parallel_apply(lambda x: 1 / 0)
+
+    with pytest.raises(ValueError):
+        df.b.parallel_apply(math.sin, backend="fibers")
+
+
+@pytest.mark.skipif(sys.version_info >= (3, 12), reason="requires Python < 3.12")
+def test_threads_backend_profile():
+    def profiled_func(x):
+        return x ** 2
+
+    series = pd.Series(np.random.rand(1000))
+
+    pandarallel.initialize(nb_workers=2, backend="threads", profile=True)
+    res_parallel = series.parallel_apply(profiled_func)
+    assert series.apply(profiled_func).equals(res_parallel)
+
+    profile = pandarallel.last_stats().profile
+    nb_calls = sum(
+        stat[1]
+        for (_, _, name), stat in profile.stats.items()
+        if name == "profiled_func"
+    )
+    assert nb_calls == 1000
+
+
+def test_threads_backend_profile_unsupported(monkeypatch):
+    # With Python >= 3.12, threads cannot profile themselves at once (which is
+    # simulated with older versions)
+    if sys.version_info < (3, 12):
+        module = importlib.import_module("pandarallel.pandarallel")
+        monkeypatch.setattr(module, "IS_THREAD_PROFILING_SUPPORTED", False)
+
+    with pytest.raises(ValueError):
+        pandarallel.initialize(nb_workers=2, backend="threads", profile=True)
+
+    pandarallel.initialize(nb_workers=2, profile=True)
+    series = pd.Series(np.random.rand(1000))
+
+    with pytest.raises(ValueError):
+        series.parallel_apply(math.sqrt, backend="threads")
@@ -0,0 +1,85 @@
+import time
+
+import pytest
+
+from pandarallel.utils.sampling import (
+    IS_MONITORING_AVAILABLE,
+    SAMPLING_PERIOD,
+    SampledProgress,
+)
+
+
+class Progression:
+    def __init__(self):
+        self.values = []
+
+    def update(self, iteration):
+        self.values.append(iteration)
+
+
+parametrize_use_monitoring = pytest.mark.parametrize(
+    "use_monitoring",
+    (
+        False,
+        pytest.param(
+            True,
+            marks=pytest.mark.skipif(
+                not IS_MONITORING_AVAILABLE, reason="sys.monitoring is not available"
+            ),
+        ),
+    ),
+)
+
+
+@parametrize_use_monitoring
+def test_sampled_progress(use_monitoring):
+    def func(x, bias=0):
+        return x + bias
+
+    progression = Progression()
+
+    with SampledProgress(progression, use_monitoring) as sampled_progress:
+        counted_func = sampled_progress.wrap(func)
+        assert (counted_func is func) == use_monitoring
+
+        assert [counted_func(x, bias=1) for x in range(10)] == list(range(1, 11))
+
+        # Let the background thread sample the counter
+        time.sleep(3 * SAMPLING_PERIOD)
+        assert progression.values[-1] == 10
+
+        for x in range(5):
+            counted_func(x)
+
+    assert progression.values[-1] == 15
+
+    # Calls are not counted anymore
+    func(0)
+    assert progression.values[-1] == 15
+
+
+@parametrize_use_monitoring
+def test_sampled_progress_recursive(use_monitoring):
+    def func(x):
+        if x < 0:
+            raise ValueError("Negative")
+
+        if x == 0:
+            return 0
+
+        # A nested call interrupted by an exception
+        try:
+            func(-1)
+        except ValueError:
+            pass
+
+        return func(x - 1) + 1
+
+    progression = Progression()
+
+    with SampledProgress(progression, use_monitoring) as sampled_progress:
+        counted_func = sampled_progress.wrap(func)
+        assert [counted_func(x) for x in range(5)] == list(range(5))
+
+    # Nested calls are not counted
+    assert progression.values[-1] == 5